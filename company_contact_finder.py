@@ -1980,8 +1980,19 @@ Return the information in this JSON format:
             print(f"\n🎯 Processing: {company_input}")
             print("=" * 60)
             
-            # Initialize results for this company
-            self.__init__()  # Reset state for new company
+            # Reset per-company state; the browser, Gemini client and email discovery
+            # session are kept so one finder can process many companies
+            self.company_domain = None
+            self.company_name = None
+            self.results = {
+                "company_domain": None,
+                "company_name": None,
+                "company_website_data": {},
+                "ceo_data": {},
+                "timestamp": int(time.time()),
+                "success": False,
+                "errors": []
+            }
             
             # Step 1: Process and normalize the company input
             company_url, company_domain = self.normalize_url(company_input)
@@ -1,5 +1,5 @@
 workers = 2  # Adjust based on your CPU cores (2-4 x num_cores)
-threads = 2  # Number of threads per worker
+threads = 100  # Number of threads per worker; each open /progress stream holds one for up to 5 minutes
 worker_class = 'gthread'  # Use threads
 timeout = 300  # Increase timeout to 5 minutes
 worker_tmp_dir = '/dev/shm'  # Use RAM for temporary files
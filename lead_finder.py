@@ -2,16 +2,24 @@
 # lead_finder.py
 
 import os
+import re
+import sys
 import json
 import time
 import random
-from playwright.sync_api import sync_playwright, Page, BrowserContext
+import queue
+import hashlib
+import threading
+import contextlib
+import functools
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote_plus
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from playwright.sync_api import sync_playwright, Page, BrowserContext, TimeoutError as PlaywrightTimeoutError
 from dotenv import load_dotenv
-from doctr.io import DocumentFile
-from doctr.models import ocr_predictor
-from PIL import Image
-import io
-import base64
+from bs4 import BeautifulSoup
+import cv2
+import numpy as np
 
 # --- Configuration ---
 load_dotenv()
@@ -21,22 +29,179 @@ GOOGLE_COOKIES_PATH = os.getenv("GOOGLE_COOKIES_PATH", "google-cookie.json")
 # Add a placeholder for LinkedIn cookies, as they will be essential for scraping profiles
 LINKEDIN_COOKIES_PATH = os.getenv("LINKEDIN_COOKIES_PATH", "linkedin_cookies.json") 
 
+# Playwright storage_state files, created from the cookie files on first run and refreshed after each session
+GOOGLE_STATE_PATH = os.getenv("GOOGLE_STATE_PATH", "google_state.json")
+LINKEDIN_STATE_PATH = os.getenv("LINKEDIN_STATE_PATH", "linkedin_state.json")
+
+# LinkedIn profile scraping runs on a small pool of browsers, one per worker thread
+LINKEDIN_POOL_SIZE = int(os.getenv("LINKEDIN_POOL_SIZE", "4"))
+# Recycle a worker's context after this many profiles so it doesn't accumulate state
+MAX_USES_PER_INSTANCE = 50
+# Lead search queries are spread over this many browsers, each pacing its own queries
+LEAD_SEARCH_WORKERS = int(os.getenv("LEAD_SEARCH_WORKERS", "3"))
+
+# On-disk cache of Google result pages so repeated queries skip the browser entirely
+GOOGLE_CACHE_DIR = os.getenv("GOOGLE_CACHE_DIR", os.path.join("cache", "google"))
+GOOGLE_CACHE_TTL = int(os.getenv("GOOGLE_CACHE_TTL", str(24 * 60 * 60)))  # 24 hours
+
+# On-disk cache of OCR text keyed by screenshot hash, so identical result pages skip docTR
+OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR", os.path.join("cache", "ocr"))
+OCR_CACHE_TTL = int(os.getenv("OCR_CACHE_TTL", str(7 * 24 * 60 * 60)))  # 7 days
+
+# Stop running further profile queries once this many unique URLs are found
+TARGET_PROFILES = 30
+
 # OCR Configuration - Using docTR (Deep Learning OCR)
-print("🔧 Initializing docTR OCR model...")
-try:
-    # Try a more robust model combination for web content
-    print("🔧 Loading docTR model (db_resnet50 + parseq)...")
-    ocr_model = ocr_predictor(det_arch='db_resnet50', reco_arch='parseq', pretrained=True)
-    print("✅ docTR OCR model (parseq) loaded successfully!")
-except Exception as e:
-    print(f"⚠️  Failed to load parseq model: {e}")
+# The model is loaded on first use so code paths that never OCR don't pay for the weights
+_ocr_model = None
+_ocr_model_loaded = False
+_ocr_model_lock = threading.Lock()
+# The predictor is shared by every lead worker's OCR thread, and torch.compile's CUDA graphs
+# ('reduce-overhead') must not be replayed from several threads at once, so inference runs one call at a time
+_ocr_inference_lock = threading.Lock()
+
+# Screenshots are upright, single-language web pages, so docTR's page-geometry passes are skipped
+OCR_PREDICTOR_OPTIONS = {
+    'assume_straight_pages': True,
+    'straighten_pages': False,
+    'detect_orientation': False,
+    'detect_language': False
+}
+
+# docTR's own detector input side; screenshots up to OCR_MAX_HEIGHT tall are already shrunk about 3x at this size
+OCR_DET_DEFAULT_SIZE = 1024
+# Side length the text detector resizes pages to. Smaller is faster (cost scales with area) but shrinks
+# ~14px SERP text further, so only lower it after checking recall on sample screenshots
+OCR_DET_INPUT_SIZE = int(os.getenv("OCR_DET_INPUT_SIZE", str(OCR_DET_DEFAULT_SIZE)))
+
+def _shrink_detection_input(model) -> bool:
+    """Lower the detector's input resolution when OCR_DET_INPUT_SIZE asks for it; False if left at docTR's default"""
+    if OCR_DET_INPUT_SIZE == OCR_DET_DEFAULT_SIZE:
+        return False
+    try:
+        model.det_predictor.pre_processor.resize.size = (OCR_DET_INPUT_SIZE, OCR_DET_INPUT_SIZE)
+        return True
+    except AttributeError as e:
+        print(f"⚠️  Could not change docTR detection input size: {e}")
+        return False
+
+def _ocr_tag(det_arch: str, reco_arch: str, det_size) -> str:
+    """Identifies the OCR setup in cache keys, so text from a different model or input size is never reused"""
+    return f"{det_arch}-{reco_arch}-{det_size}"
+
+# Tag of the loaded model; until it loads, the one get_ocr_model tries first
+_ocr_model_tag = _ocr_tag('db_resnet50', 'parseq', OCR_DET_INPUT_SIZE)
+
+_ocr_on_gpu = False
+
+# Batch sizes to warm up on the GPU; the main flow OCRs one page at a time
+OCR_WARMUP_BATCH_SIZES = (1,)
+
+def _accelerate_ocr_model(model):
+    """Move docTR's detector and recognizer to the GPU in bfloat16 and compile them, when CUDA is available"""
+    global _ocr_on_gpu
     try:
-        print("🔧 Falling back to default model...")
-        ocr_model = ocr_predictor(det_arch='db_resnet50', reco_arch='crnn_vgg16_bn', pretrained=True)
-        print("✅ docTR OCR model (crnn_vgg16_bn) loaded successfully!")
-    except Exception as e2:
-        print(f"❌ Failed to load any docTR model: {e2}")
-        ocr_model = None
+        import torch
+    except ImportError:
+        return
+    if not torch.cuda.is_available():
+        return
+    
+    try:
+        for predictor in (model.det_predictor, model.reco_predictor):
+            predictor.model = predictor.model.to(device='cuda', dtype=torch.bfloat16)
+            predictor.model = torch.compile(predictor.model, mode='reduce-overhead', fullgraph=False)
+        _ocr_on_gpu = True
+        print("⚡ docTR running on GPU (bfloat16, torch.compile)")
+    except Exception as e:
+        print(f"⚠️  Could not accelerate docTR model, using defaults: {e}")
+
+def _warm_up_ocr_model(model):
+    """Let cuDNN pick its kernels and torch.compile trace the model before the first real page"""
+    if not _ocr_on_gpu:
+        return
+    
+    import torch
+    torch.backends.cudnn.benchmark = True
+    
+    # Warmup is per input shape, so use one the size of a clipped screenshot for each batch size used
+    dummy_page = np.zeros((OCR_MAX_HEIGHT, 1920, 3), dtype=np.uint8)
+    for batch_size in OCR_WARMUP_BATCH_SIZES:
+        try:
+            with _ocr_inference_context():
+                model([dummy_page] * batch_size)
+        except Exception as e:
+            print(f"⚠️  docTR warmup failed for batch size {batch_size}: {e}")
+            return
+    print("🔥 docTR warmed up")
+
+def _ocr_inference_context():
+    """Inference-mode + bfloat16 autocast on the GPU, a no-op context otherwise"""
+    if not _ocr_on_gpu:
+        return contextlib.nullcontext()
+    import torch
+    stack = contextlib.ExitStack()
+    stack.enter_context(torch.inference_mode())
+    stack.enter_context(torch.autocast('cuda', dtype=torch.bfloat16))
+    return stack
+
+def get_ocr_model():
+    """Return the shared docTR predictor, loading it on first call (None if no model could be loaded)"""
+    global _ocr_model, _ocr_model_loaded, _ocr_model_tag
+    if _ocr_model_loaded:
+        return _ocr_model
+    
+    with _ocr_model_lock:
+        if _ocr_model_loaded:
+            return _ocr_model
+        
+        print("🔧 Initializing docTR OCR model...")
+        # docTR pulls in torch, so it is only imported once OCR is actually needed
+        try:
+            from doctr.models import ocr_predictor
+        except ImportError as e:
+            print(f"❌ docTR is not installed: {e}")
+            _ocr_model_loaded = True
+            return None
+        
+        try:
+            # Try a more robust model combination for web content
+            print("🔧 Loading docTR model (db_resnet50 + parseq)...")
+            _ocr_model = ocr_predictor(det_arch='db_resnet50', reco_arch='parseq', pretrained=True, **OCR_PREDICTOR_OPTIONS)
+            reco_arch = 'parseq'
+            print("✅ docTR OCR model (parseq) loaded successfully!")
+        except Exception as e:
+            print(f"⚠️  Failed to load parseq model: {e}")
+            try:
+                print("🔧 Falling back to default model...")
+                _ocr_model = ocr_predictor(det_arch='db_resnet50', reco_arch='crnn_vgg16_bn', pretrained=True, **OCR_PREDICTOR_OPTIONS)
+                reco_arch = 'crnn_vgg16_bn'
+                print("✅ docTR OCR model (crnn_vgg16_bn) loaded successfully!")
+            except Exception as e2:
+                print(f"❌ Failed to load any docTR model: {e2}")
+                _ocr_model = None
+        
+        if _ocr_model is not None:
+            shrunk = _shrink_detection_input(_ocr_model)
+            _ocr_model_tag = _ocr_tag('db_resnet50', reco_arch, OCR_DET_INPUT_SIZE if shrunk else OCR_DET_DEFAULT_SIZE)
+            _accelerate_ocr_model(_ocr_model)
+            _warm_up_ocr_model(_ocr_model)
+        
+        _ocr_model_loaded = True
+        return _ocr_model
+
+# Debug screenshots are only kept when explicitly enabled
+SAVE_DEBUG_SCREENSHOTS = os.getenv("SAVE_DEBUG_SCREENSHOTS") == "1"
+
+# Background writer for debug screenshots
+_debug_io_pool = ThreadPoolExecutor(max_workers=2)
+
+# Only the top of a results page is OCR'd; detection cost grows with the pixel area
+OCR_MAX_HEIGHT = 3000
+
+# Screenshots waiting for OCR, and how many the OCR thread runs through docTR at once
+OCR_QUEUE_SIZE = 8
+OCR_BATCH_SIZE = 4
 
 # --- Captcha Bypass Strategies ---
 
@@ -49,40 +214,311 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15"
 ]
 
-# Add random delays to mimic human behavior
-def human_like_delay():
-    """Add random delays to mimic human behavior"""
-    base_delay = random.uniform(2, 5)
-    time.sleep(base_delay)
+# OS-level entropy for fingerprint choices
+_RNG = random.SystemRandom()
+
+def _build_ua_profile(user_agent: str) -> dict:
+    """Build context options whose headers are consistent with the browser in the user agent"""
+    headers = {
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1"
+    }
+    
+    if "Firefox/" in user_agent:
+        headers["Accept"] = "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
+        headers["Accept-Language"] = "en-US,en;q=0.5"
+    elif "Chrome/" in user_agent:
+        version = user_agent.split("Chrome/")[1].split(".")[0]
+        platform = "macOS" if "Macintosh" in user_agent else "Windows"
+        headers["Accept"] = "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8"
+        headers["sec-ch-ua"] = f'"Not_A Brand";v="8", "Chromium";v="{version}", "Google Chrome";v="{version}"'
+        headers["sec-ch-ua-mobile"] = "?0"
+        headers["sec-ch-ua-platform"] = f'"{platform}"'
+    else:
+        # Safari
+        headers["Accept"] = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+    
+    return {"user_agent": user_agent, "extra_http_headers": headers}
+
+# Built once at import so creating a context only has to pick one
+UA_PROFILES = tuple(_build_ua_profile(ua) for ua in USER_AGENTS)
+
+# --- Response Caching ---
+
+# Google appends tracking parameters that change on every visit without changing the results
+VOLATILE_QUERY_PARAMS = {'ved', 'ei', 'uact', 'sa', 'sxsrf', 'gs_lcp', 'sclient', 'oq', 'aqs', 'sourceid', 'iflsig'}
+
+def google_search_url(query: str) -> str:
+    """Google results URL for a query, with quotes, colons and @ properly encoded"""
+    return f"https://www.google.com/search?q={quote_plus(query)}"
+
+def normalize_search_url(url: str) -> str:
+    """Strip volatile tracking parameters from a Google URL so equivalent searches share a key"""
+    parts = urlsplit(url)
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in VOLATILE_QUERY_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(sorted(params)), ''))
+
+class ResponseCache:
+    """Stores Google result pages on disk as JSON files keyed by a hash of the search URL"""
+    
+    def __init__(self, cache_dir: str = GOOGLE_CACHE_DIR, ttl: int = GOOGLE_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _path(self, url: str) -> str:
+        cache_key = hashlib.md5(normalize_search_url(url).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{cache_key}.json")
+    
+    def get(self, url: str):
+        """Return the cached HTML for a URL, or None if missing or expired"""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - entry.get('timestamp', 0) > self.ttl:
+            return None
+        return entry.get('html')
+    
+    def set(self, url: str, html: str):
+        """Store the HTML for a URL"""
+        entry = {'timestamp': time.time(), 'url': normalize_search_url(url), 'html': html}
+        try:
+            with open(self._path(url), 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+        except OSError as e:
+            print(f"⚠️  Could not write cache entry: {e}")
+
+google_cache = ResponseCache()
+
+class OCRCache:
+    """Stores OCR text on disk keyed by a hash of the screenshot bytes and the OCR model"""
+    
+    def __init__(self, cache_dir: str = OCR_CACHE_DIR, ttl: int = OCR_CACHE_TTL, model_tag: str = None):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        # None follows whichever docTR model get_ocr_model actually loaded
+        self._model_tag = model_tag
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    @property
+    def model_tag(self) -> str:
+        return self._model_tag or _ocr_model_tag
+    
+    def _path(self, screenshot: bytes) -> str:
+        cache_key = hashlib.blake2b(screenshot, digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{cache_key}_{self.model_tag}.json")
+    
+    def get(self, screenshot: bytes):
+        """Return the cached OCR text for a screenshot, or None if missing or expired"""
+        try:
+            with open(self._path(screenshot), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - entry.get('timestamp', 0) > self.ttl:
+            return None
+        return entry.get('text')
+    
+    def set(self, screenshot: bytes, text: str):
+        """Store the OCR text for a screenshot"""
+        try:
+            with open(self._path(screenshot), 'w', encoding='utf-8') as f:
+                json.dump({'timestamp': time.time(), 'text': text}, f)
+        except OSError as e:
+            print(f"⚠️  Could not write OCR cache entry: {e}")
+
+ocr_cache = OCRCache()
+
+# Static Google assets (CSS/JS/fonts) are identical across result pages; images include per-query thumbnails
+STATIC_RESOURCE_TYPES = {'stylesheet', 'script', 'font'}
+# Total body bytes kept in the static asset cache, shared by every worker; least recently used go first
+STATIC_ASSET_CACHE_MAX_BYTES = int(os.getenv("STATIC_ASSET_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Describe the bytes as fetched over the wire; the cached body is already decoded
+STRIPPED_ASSET_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding'})
+_static_asset_cache = OrderedDict()
+_static_asset_cache_bytes = 0
+_static_asset_cache_lock = threading.Lock()
+
+def _get_static_asset(url: str):
+    """Cached (headers, body) for a URL, marking it recently used; None on a miss"""
+    with _static_asset_cache_lock:
+        cached = _static_asset_cache.get(url)
+        if cached is not None:
+            _static_asset_cache.move_to_end(url)
+        return cached
+
+def _put_static_asset(url: str, headers: dict, body: bytes):
+    """Cache an asset, evicting the least recently used ones beyond STATIC_ASSET_CACHE_MAX_BYTES"""
+    global _static_asset_cache_bytes
+    if len(body) > STATIC_ASSET_CACHE_MAX_BYTES:
+        return
+    headers = {k: v for k, v in headers.items() if k.lower() not in STRIPPED_ASSET_HEADERS}
+    with _static_asset_cache_lock:
+        previous = _static_asset_cache.pop(url, None)
+        if previous is not None:
+            _static_asset_cache_bytes -= len(previous[1])
+        _static_asset_cache[url] = (headers, body)
+        _static_asset_cache_bytes += len(body)
+        while _static_asset_cache_bytes > STATIC_ASSET_CACHE_MAX_BYTES:
+            _, (_, evicted) = _static_asset_cache.popitem(last=False)
+            _static_asset_cache_bytes -= len(evicted)
+
+def install_static_asset_cache(context: BrowserContext):
+    """Serve repeated static Google assets from memory instead of re-downloading them per query"""
+    def handle_route(route):
+        request = route.request
+        if request.resource_type not in STATIC_RESOURCE_TYPES or request.method != 'GET':
+            return route.continue_()
+        
+        cached = _get_static_asset(request.url)
+        if cached is not None:
+            headers, body = cached
+            return route.fulfill(status=200, headers=headers, body=body)
+        
+        try:
+            response = route.fetch()
+        except Exception:
+            return route.continue_()
+        
+        if response.ok:
+            _put_static_asset(request.url, response.headers, response.body())
+        return route.fulfill(response=response)
+    
+    context.route("**/*", handle_route)
+
+# Google's results container, present as soon as a results page is usable
+SEARCH_RESULTS_SELECTOR = "#search, div[role='main']"
+
+# Seconds a context is assumed captcha-free after a results page rendered cleanly
+CAPTCHA_CLEAN_WINDOW = 60
+
+# Attribute-based consent buttons, merged into one CSS selector so a single query covers them all
+CONSENT_BUTTON_SELECTOR = ",".join([
+    "button[aria-label*='Accept']",
+    "button[data-identifier*='accept']",
+    "button[id*='accept']",
+    "button[class*='accept']"
+])
+
+# Words in button labels that accept cookies (English, Dutch, German, French, Spanish, Italian)
+CONSENT_BUTTON_KEYWORDS = frozenset({
+    'accept', 'ok', 'yes', 'continue', 'accepteren', 'akzeptieren', 'accepter', 'aceptar', 'accetta'
+})
+_CONSENT_BUTTON_KEYWORD_LIST = sorted(CONSENT_BUTTON_KEYWORDS)
+
+# --- Resource Blocking ---
+
+# The scrapers only read text and links, so these downloads are pure overhead.
+# Google keeps its stylesheets because OCR screenshots depend on them. LinkedIn profiles are read
+# from DOM text only, and class selectors match without the CSS loaded, so LinkedIn drops them too.
+GOOGLE_BLOCKED_RESOURCES = frozenset({"image", "media", "font"})
+LINKEDIN_BLOCKED_RESOURCES = frozenset({"image", "media", "font", "stylesheet"})
+BLOCKED_HOSTS = ("google-analytics.com", "doubleclick.net", "googletagmanager.com", "gstatic.com/recaptcha")
+
+def install_resource_blocker(context: BrowserContext, resource_types: frozenset):
+    """Abort requests for the given resource types and known analytics hosts"""
+    def handle_route(route):
+        request = route.request
+        if request.resource_type in resource_types or any(host in request.url for host in BLOCKED_HOSTS):
+            return route.abort()
+        return route.fallback()
+    
+    context.route("**/*", handle_route)
+
+class RateLimiter:
+    """Spaces out requests to one host with a jittered interval, sleeping only for the time not already spent.
+    Safe to share between threads: each caller reserves its own slot."""
+    
+    def __init__(self, host: str, rps: float, jitter: float = 0.0):
+        self.host = host
+        self.interval = 1.0 / rps
+        self.jitter = jitter
+        self.last_request_time = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the next request to this host is allowed"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.last_request_time + self.interval + random.uniform(-self.jitter, self.jitter))
+            self.last_request_time = start
+        if start > now:
+            time.sleep(start - now)
+
+def get_google_rate_limiter(context: BrowserContext) -> RateLimiter:
+    """Each context paces its own Google requests, so parallel contexts don't sleep in lockstep"""
+    limiter = getattr(context, '_google_rate_limiter', None)
+    if limiter is None:
+        limiter = RateLimiter('google.com', rps=0.25, jitter=1.5)
+        context._google_rate_limiter = limiter
+    return limiter
+
+# Paces the OCR pass of every lead search worker together (one every 2-4 seconds), instead of each worker sleeping on its own
+lead_query_rate_limiter = RateLimiter('google.com', rps=1 / 3, jitter=1.0)
 
 def cleanup_debug_screenshots(keep_recent=5):
-    """Clean up old debug screenshots, keeping only the most recent ones"""
+    """Clean up old debug screenshots, keeping only the most recent ones.
+    
+    Safe to run while new screenshots are being written: files are ranked by mtime,
+    so the ones this run creates are always among the newest and are kept.
+    """
     try:
-        screenshots_dir = "Screenshots"
-        if not os.path.exists(screenshots_dir):
-            return
-            
-        debug_files = [f for f in os.listdir(screenshots_dir) if f.startswith('debug_screenshot_') and f.endswith('.png')]
-        if len(debug_files) > keep_recent:
-            # Sort by modification time (newest first)
-            debug_files.sort(key=lambda x: os.path.getmtime(os.path.join(screenshots_dir, x)), reverse=True)
-            # Remove old files
-            for old_file in debug_files[keep_recent:]:
-                try:
-                    os.remove(os.path.join(screenshots_dir, old_file))
-                    print(f"🧹 Cleaned up old debug screenshot: {old_file}")
-                except:
-                    pass
+        # scandir returns cached stat data with each entry, avoiding a stat call per file
+        with os.scandir("Screenshots") as it:
+            debug_files = [e for e in it if e.name.startswith('debug_screenshot_') and e.name.endswith(('.jpg', '.png'))]
+    except FileNotFoundError:
+        return
     except Exception as e:
         print(f"⚠️  Could not cleanup debug screenshots: {e}")
+        return
+    
+    if len(debug_files) > keep_recent:
+        # Sort by modification time (newest first)
+        debug_files.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        # Remove old files
+        for old_file in debug_files[keep_recent:]:
+            try:
+                os.unlink(old_file.path)
+                print(f"🧹 Cleaned up old debug screenshot: {old_file.name}")
+            except OSError:
+                pass
+
+def _page_text_flags(page: Page) -> dict:
+    """Match the page's visible text against the captcha and consent phrases in one round-trip"""
+    try:
+        return page.evaluate("""() => {
+            const text = (document.body && document.body.innerText) || '';
+            return {
+                captcha: /unusual activity|verify you|robot/i.test(text),
+                consent: /cookie|consent|privacy/i.test(text)
+            };
+        }""")
+    except Exception:
+        return {'captcha': False, 'consent': False}
 
 def handle_captcha_and_consent(page: Page) -> bool:
     """Handle Google captcha challenges and cookie consent dialogs"""
+    # Skip the checks while the context is known to be clean
+    if time.monotonic() < getattr(page.context, '_captcha_clean_until', 0):
+        return True
+    
     print("🔍 Checking for captcha or consent dialogs...")
     
+    # Scan the visible text once and share the answers with both checks
+    text_flags = _page_text_flags(page)
+    
     # First, try to handle cookie consent dialogs
-    if handle_cookie_consent(page):
+    if handle_cookie_consent(page, text_flags):
         print("✅ Cookie consent handled successfully!")
+        # The page changed, so the earlier scan no longer applies
+        text_flags = _page_text_flags(page)
     
     # Then check for captchas
     captcha_indicators = [
@@ -103,12 +539,8 @@ def handle_captcha_and_consent(page: Page) -> bool:
             continue
     
     if not captcha_found:
-        # Check for other captcha-like elements
-        try:
-            if "unusual activity" in page.content().lower() or "verify" in page.content().lower():
-                captcha_found = True
-        except:
-            pass
+        # Check for other captcha-like text
+        captcha_found = text_flags['captcha']
     
     if captcha_found:
         print("🔒 Captcha challenge detected!")
@@ -128,81 +560,85 @@ def handle_captcha_and_consent(page: Page) -> bool:
             # Wait for captcha to be solved (look for search results)
             page.wait_for_selector('div.g', timeout=120000)  # 2 minutes timeout
             print("✅ Captcha appears to be solved! Continuing...")
+            _mark_context_clean(page)
             return True
         except Exception as e:
             print("⏰ Timeout waiting for captcha solution.")
             print("💡 Tip: Make sure to complete the captcha and wait for search results to appear.")
             return False
     
+    _mark_context_clean(page)
     return True
 
-def handle_cookie_consent(page: Page) -> bool:
+def _mark_context_clean(page: Page):
+    """Skip the consent/captcha checks for CAPTCHA_CLEAN_WINDOW seconds after a page passed them"""
+    page.context._captcha_clean_until = time.monotonic() + CAPTCHA_CLEAN_WINDOW
+
+# Several browsers may save the Google state at once
+_google_state_lock = threading.Lock()
+
+def save_google_state(context: BrowserContext):
+    """Write the context's cookies and storage to GOOGLE_STATE_PATH, logging instead of raising on failure"""
+    try:
+        with _google_state_lock:
+            context.storage_state(path=GOOGLE_STATE_PATH)
+    except Exception as e:
+        print(f"⚠️  Could not save browser state: {e}")
+
+def _remember_consent(context: BrowserContext):
+    """Mark consent as given and persist the consent cookie so the next run starts past the dialog"""
+    context._consent_handled = True
+    save_google_state(context)
+
+def handle_cookie_consent(page: Page, text_flags: dict = None) -> bool:
     """Handle Google cookie consent dialogs automatically"""
+    # Consent only needs to be given once per context
+    if getattr(page.context, '_consent_handled', False):
+        return False
+    
     try:
-        # Wait a moment for the page to load
-        page.wait_for_timeout(2000)
-        
-        # Common cookie consent button selectors
-        consent_selectors = [
-            # Accept all buttons
-            "button[aria-label*='Accept all']",
-            "button:has-text('Accept all')",
-            "button:has-text('Alles accepteren')",  # Dutch
-            "button:has-text('Alle akzeptieren')",  # German
-            "button:has-text('Tout accepter')",     # French
-            "button:has-text('Aceptar todo')",      # Spanish
-            "button:has-text('Accetta tutto')",     # Italian
+        # Try all attribute-based accept buttons in a single query
+        consent_buttons = page.locator(CONSENT_BUTTON_SELECTOR)
+        if consent_buttons.count() > 0:
+            print("🎯 Found consent button")
+            consent_buttons.first.click()
+            print("✅ Clicked consent button!")
+            _remember_consent(page.context)
             
-            # Accept buttons (without "all")
-            "button[aria-label*='Accept']",
-            "button:has-text('Accept')",
-            "button:has-text('Akzeptieren')",
-            "button:has-text('Accepter')",
-            "button:has-text('Aceptar')",
-            "button:has-text('Accetta')",
-            
-            # Generic accept patterns
-            "button[data-identifier*='accept']",
-            "button[id*='accept']",
-            "button[class*='accept']",
-            
-            # Language switcher (if needed)
-            "button:has-text('Change to English')",
-            "button:has-text('English')",
-            "a:has-text('English')"
-        ]
-        
-        # Try to find and click consent buttons
-        for selector in consent_selectors:
+            # Wait for the dialog to disappear
             try:
-                if page.locator(selector).count() > 0:
-                    print(f"🎯 Found consent button: {selector}")
-                    page.locator(selector).first.click()
-                    print("✅ Clicked consent button!")
-                    
-                    # Wait for the dialog to disappear
-                    page.wait_for_timeout(2000)
-                    return True
-            except Exception as e:
-                continue
+                page.wait_for_selector(CONSENT_BUTTON_SELECTOR, state='detached', timeout=2000)
+            except PlaywrightTimeoutError:
+                pass
+            return True
         
         # If no buttons found, try to find by text content
-        page_content = page.content().lower()
-        if any(phrase in page_content for phrase in ['cookie', 'consent', 'privacy', 'accept', 'akzeptieren', 'accepter']):
+        if text_flags is None:
+            text_flags = _page_text_flags(page)
+        if text_flags['consent']:
             print("🔍 Cookie consent dialog detected, attempting to handle...")
             
-            # Try clicking any button that might be an accept button
-            buttons = page.locator('button').all()
-            for button in buttons:
+            # Tokenize button labels inside the browser and click the first one containing a keyword.
+            # Whole-word matching keeps labels like "do-not-accept" from matching.
+            clicked_text = page.evaluate("""(keywords) => {
+                const wanted = new Set(keywords);
+                const button = Array.from(document.querySelectorAll('button')).find(b =>
+                    (b.innerText || '').toLowerCase().split(/\\s+/)
+                        .some(word => wanted.has(word.replace(/^[^\\p{L}]+|[^\\p{L}]+$/gu, '')))
+                );
+                if (!button) return null;
+                button.click();
+                return button.innerText;
+            }""", _CONSENT_BUTTON_KEYWORD_LIST)
+            
+            if clicked_text is not None:
+                print(f"🎯 Clicked button: {clicked_text.strip().lower()}")
+                _remember_consent(page.context)
                 try:
-                    button_text = button.inner_text().lower()
-                    if any(word in button_text for word in ['accept', 'ok', 'yes', 'continue', 'akzeptieren', 'accepter']):
-                        print(f"🎯 Clicking button: {button_text}")
-                        button.click()
-                        page.wait_for_timeout(2000)
-                        return True
-                except:
-                    continue
+                    page.wait_for_load_state('domcontentloaded', timeout=2000)
+                except PlaywrightTimeoutError:
+                    pass
+                return True
         
         return False
         
@@ -210,27 +646,125 @@ def handle_cookie_consent(page: Page) -> bool:
         print(f"⚠️  Error handling cookie consent: {e}")
         return False
 
-def search_google_for_profiles(page: Page, company_name: str) -> list[str]:
-    """Searches Google for decision-maker profiles and returns a list of URLs."""
-    print(f"Searching Google for decision-makers at '{company_name}'...")
+def cached_content(page: Page) -> str:
+    """Return page.content(), serializing the DOM at most once per navigation"""
+    cache = getattr(page, '_content_cache', None)
+    if cache is None:
+        cache = page._content_cache = {}
+        # Any main-frame navigation invalidates the snapshot
+        page.on('framenavigated', lambda frame: cache.clear() if frame == page.main_frame else None)
+    
+    key = page.main_frame.url
+    if key not in cache:
+        cache[key] = page.content()
+    return cache[key]
+
+def _watch_for_captcha_responses(page: Page):
+    """Clear the context's clean flag as soon as Google answers with a block or captcha page"""
+    if getattr(page, '_captcha_watch_installed', False):
+        return
     
+    def on_response(response):
+        if response.status in (403, 429) or 'sorry/index' in response.url:
+            page.context._captcha_clean_until = 0
+    
+    page.on('response', on_response)
+    page._captcha_watch_installed = True
+
+def goto_search_results(page: Page, search_url: str):
+    """Navigate to a Google results page and return as soon as the results container attaches"""
+    _watch_for_captcha_responses(page)
+    page.goto(search_url, wait_until="commit")
+    try:
+        # The consent/captcha check still runs on this page; only its success opens the clean window
+        page.wait_for_selector(SEARCH_RESULTS_SELECTOR, timeout=10000)
+    except PlaywrightTimeoutError:
+        # Consent and captcha pages have no results container; the handlers deal with those
+        pass
+
+# LinkedIn or Twitter profile links, excluding Twitter's own navigation pages
+PROFILE_RE = re.compile(r'^https?://(?:[^/]*\.)?(?:linkedin\.com/in/|twitter\.com/(?!(?:home|search|i)(?:[/?#]|$)))')
+
+# Social profile sites recognised in result links; the captured group identifies the platform
+SOCIAL_LINK_RE = re.compile(r'(linkedin\.com/in/|instagram\.com/|twitter\.com/|x\.com/|facebook\.com/|youtube\.com/|tiktok\.com/)')
+
+# Platform of an extracted link, stored as link['platform']
+PLATFORM_OTHER, PLATFORM_LINKEDIN, PLATFORM_INSTAGRAM, PLATFORM_TWITTER, PLATFORM_EMAIL, PLATFORM_SOCIAL = range(6)
+
+# SOCIAL_LINK_RE matches with their own platform; any other match is PLATFORM_SOCIAL
+_SOCIAL_KIND_PLATFORM = {
+    'linkedin.com/in/': PLATFORM_LINKEDIN,
+    'instagram.com/': PLATFORM_INSTAGRAM,
+    'twitter.com/': PLATFORM_TWITTER,
+    'x.com/': PLATFORM_TWITTER,
+}
+
+# Platforms that are social media profiles, as opposed to emails and plain links
+SOCIAL_PLATFORMS = frozenset({PLATFORM_LINKEDIN, PLATFORM_INSTAGRAM, PLATFORM_TWITTER, PLATFORM_SOCIAL})
+
+# Display label per platform, indexed by the platform number
+_ICONS = ("🔗 Link", "💼 LinkedIn", "📸 Instagram", "🐦 X/Twitter", "📧 Email", "🌐 Social")
+
+# Profile URLs found per query during this process, so repeated queries skip Google entirely
+_query_results = {}
+
+def is_profile_url(href: str) -> bool:
+    """Check whether a search result link points to a LinkedIn or Twitter profile"""
+    return PROFILE_RE.match(href) is not None and "google.com" not in href
+
+def build_profile_queries(company_name: str) -> list[str]:
+    """Google queries used to find decision-maker profiles for a company"""
     # More targeted search queries are better
-    search_queries = [
+    return [
         f'"{company_name}" CEO OR founder site:linkedin.com/in/',
         f'"{company_name}" executive site:twitter.com',
         f'"{company_name}" CTO site:linkedin.com/in/'
     ]
+
+def search_google_for_profiles(page: Page, company_name: str, target_profiles: int = TARGET_PROFILES,
+                               search_queries: list[str] = None) -> list[str]:
+    """Searches Google for decision-maker profiles and returns a list of URLs.
+    
+    Stops issuing queries once target_profiles unique URLs have been collected.
+    """
+    print(f"Searching Google for decision-makers at '{company_name}'...")
+    
+    if search_queries is None:
+        search_queries = build_profile_queries(company_name)
     
     profile_urls = set()
     
-    for query in search_queries:
+    search_urls = [google_search_url(query) for query in search_queries]
+    
+    for query, search_url in zip(search_queries, search_urls):
+        # Later queries add little once the first ones have found enough profiles
+        if len(profile_urls) >= target_profiles:
+            print(f"  ✅ Collected {len(profile_urls)} profiles, skipping remaining queries")
+            break
+        
         print(f"  > Executing query: {query}")
+        # Queries already executed in this process are reused as-is
+        if query in _query_results:
+            profile_urls.update(_query_results[query])
+            print(f"    ♻️  Reusing {len(_query_results[query])} profile URLs from this session")
+            continue
         
-        # Add random delay between queries
-        human_like_delay()
+        # Serve repeated queries from the on-disk cache without touching the browser
+        cached_html = google_cache.get(search_url)
+        if cached_html is not None:
+            soup = BeautifulSoup(cached_html, 'html.parser')
+            hrefs = {a['href'] for a in soup.select('a[href]')}
+            cached_profiles = [href for href in hrefs if is_profile_url(href)]
+            profile_urls.update(cached_profiles)
+            _query_results[query] = frozenset(cached_profiles)
+            print(f"    ♻️  Cache hit: {len(cached_profiles)} profile URLs")
+            continue
+        
+        # Pace queries with a single jittered budget per context
+        get_google_rate_limiter(page.context).wait()
         
         try:
-            page.goto(f"https://www.google.com/search?q={query}", wait_until="domcontentloaded")
+            goto_search_results(page, search_url)
             
             # Check for captcha and consent dialogs before proceeding
             if not handle_captcha_and_consent(page):
@@ -256,9 +790,9 @@ def search_google_for_profiles(page: Page, company_name: str) -> list[str]:
             print(f"❌ Error navigating to search page: {e}")
             print("🔄 Retrying with a new page...")
             try:
-                # Create a new page if the current one is closed
-                page = context.new_page()
-                page.goto(f"https://www.google.com/search?q={query}", wait_until="domcontentloaded")
+                # Create a new page in the same context if the current one is closed
+                page = page.context.new_page()
+                goto_search_results(page, search_url)
                 
                 if not handle_captcha_and_consent(page):
                     print(f"❌ Failed to handle captcha/consent for query: {query}")
@@ -267,235 +801,445 @@ def search_google_for_profiles(page: Page, company_name: str) -> list[str]:
                 print(f"❌ Failed to retry: {retry_error}")
                 continue
         
-        # Look for search result links with multiple selectors
+        # Collect every result link in a single round-trip to the browser
         try:
-            # Wait for search results to load
-            page.wait_for_timeout(3000)
-            
-            # Try multiple selectors for Google search results
-            search_selectors = [
-                'div.g a[href]',           # Standard Google results
-                'div[data-hveid] a[href]', # Alternative Google format
-                'div[jscontroller] a[href]', # Another Google format
-                'h3 a[href]',              # Headline links
-                'div[class*="g"] a[href]', # Generic Google result class
-                'div[class*="result"] a[href]', # Result class
-                'div[class*="search"] a[href]'  # Search class
-            ]
+            # Deduplicated in the browser, so each URL crosses CDP and gets classified once
+            hrefs = page.evaluate("() => [...new Set(Array.from(document.querySelectorAll('a[href]'), a => a.href))]")
             
-            all_links = []
-            for selector in search_selectors:
-                try:
-                    links = page.locator(selector).all()
-                    if links:
-                        all_links.extend(links)
-                        print(f"    Found {len(links)} links with selector: {selector}")
-                except:
-                    continue
+            profile_links = [href for href in hrefs if is_profile_url(href)]
+            profile_urls.update(profile_links)
+            _query_results[query] = frozenset(profile_links)
+            for href in profile_links:
+                print(f"      ✅ Found profile: {href}")
             
-            # Remove duplicates and filter for profile URLs
-            profile_links = []
-            for link in all_links:
-                try:
-                    href = link.get_attribute('href')
-                    if href:
-                        # Debug: print what we're finding
-                        if "linkedin.com/in/" in href or "twitter.com/" in href:
-                            if "google.com" not in href:
-                                profile_urls.add(href)
-                                profile_links.append(href)
-                                print(f"      ✅ Found profile: {href}")
-                        elif "linkedin.com" in href or "twitter.com" in href:
-                            print(f"      🔍 Found social link: {href}")
-                        else:
-                            print(f"      📄 Found other link: {href}")
-                except Exception as e:
-                    continue
-            
-            print(f"    Total links found: {len(all_links)}")
+            print(f"    Unique links found: {len(hrefs)}")
             print(f"    Profile URLs extracted: {len(profile_links)}")
             
+            # Pages without profiles (blocked, empty or odd layouts) are fetched again next time
+            if profile_links:
+                google_cache.set(search_url, cached_content(page))
+            
         except Exception as e:
             print(f"    Error processing search results: {e}")
             continue
-        
-        # Add delay between queries to be respectful
-        time.sleep(random.uniform(3, 6))
     
     print(f"Found {len(profile_urls)} potential profiles.")
     return list(profile_urls)
 
+# Google's search box, present on both the home page and results pages
+SEARCH_BOX_SELECTOR = 'textarea[name="q"], input[name="q"]'
+
+def submit_search(page: Page, query: str):
+    """Run a query from the page's own search box, navigating by URL only when there is none"""
+    # Searches can land on a block page too, which must end the captcha-clean window
+    _watch_for_captcha_responses(page)
+    search_box = page.locator(SEARCH_BOX_SELECTOR).first
+    if "google." in page.url and search_box.count() > 0:
+        try:
+            search_box.fill(query)
+            with page.expect_navigation(wait_until="domcontentloaded"):
+                search_box.press("Enter")
+            return
+        except Exception as e:
+            print(f"⚠️  Search box submit failed, navigating directly: {e}")
+    
+    page.goto(google_search_url(query), wait_until="domcontentloaded")
+
+# Plays back a list of [dy, delay_ms] scroll steps inside the page
+SCROLL_PLAN_JS = """async (steps) => {
+    for (const [dy, ms] of steps) {
+        window.scrollBy(0, dy);
+        await new Promise(resolve => setTimeout(resolve, ms));
+    }
+}"""
+
+def build_scroll_plan() -> list:
+    """Random reading-like scroll steps: a few 300px steps down, then a few 200px steps back up"""
+    scroll_down = [(300, random.randint(500, 1500)) for _ in range(random.randint(2, 5))]
+    scroll_up = [(-200, random.randint(300, 1000)) for _ in range(random.randint(1, 3))]
+    return scroll_down + scroll_up
+
+def wait_for_network_idle(page: Page, timeout: int = 5000):
+    """Wait until the page stops loading, returning early if it already has"""
+    try:
+        page.wait_for_load_state('networkidle', timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+def prepare_search_page(page: Page) -> bool:
+    """Handles captcha/consent dialogs and waits for results. Returns False if the dialogs could not be handled."""
+    # Wait until either results or a consent dialog is on the page, rather than a fixed delay
+    try:
+        page.wait_for_selector('div.g, [aria-label="Accept all"]', timeout=5000, state='attached')
+    except PlaywrightTimeoutError:
+        pass
+    
+    # Handle captcha and consent dialogs first
+    if not handle_captcha_and_consent(page):
+        print("❌ Failed to handle captcha/consent dialogs")
+        return False
+    
+    # Wait for search results to appear
+    try:
+        page.wait_for_selector('div.g', timeout=10000)
+        print("✅ Search results detected")
+    except:
+        print("⚠️  Search results selector not found, continuing anyway...")
+    
+    return True
+
+def _search_profiles_worker(company_name: str, query: str) -> set:
+    """Runs one profile query in its own browser; sync Playwright objects can't cross threads"""
+    with sync_playwright() as p:
+        browser, context = create_browser_context(p, storage_state=GOOGLE_STATE_PATH)
+        install_resource_blocker(context, GOOGLE_BLOCKED_RESOURCES)
+        try:
+            page = context.new_page()
+            return set(search_google_for_profiles(page, company_name, search_queries=[query]))
+        finally:
+            browser.close()
+
+def search_google_for_profiles_parallel(company_name: str) -> list[str]:
+    """Runs every profile query at once, each in its own browser context with its own cookies and user agent"""
+    search_queries = build_profile_queries(company_name)
+    print(f"Searching Google for decision-makers at '{company_name}' with {len(search_queries)} parallel browsers...")
+    
+    with ThreadPoolExecutor(max_workers=len(search_queries)) as executor:
+        futures = [executor.submit(_search_profiles_worker, company_name, query) for query in search_queries]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"⚠️  Profile search worker failed: {e}")
+    
+    profile_urls = set().union(*results)
+    print(f"Found {len(profile_urls)} potential profiles.")
+    return list(profile_urls)
+
+def _elide(text: str, limit: int) -> str:
+    """Truncate text to limit characters with a trailing "...", leaving shorter text untouched"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def extract_dom_fast(page: Page) -> list:
+    """Reads the text and links of every search result block in a single page.evaluate call"""
+    return page.evaluate("""() => {
+        const outermost = (els) => els.filter(e => !els.some(o => o !== e && o.contains(e)));
+        let blocks = outermost(Array.from(document.querySelectorAll('div.g')));
+        if (!blocks.length) {
+            blocks = outermost(Array.from(document.querySelectorAll('div[data-hveid]')));
+        }
+        // Blocks with a title but no readable text are masked; those still need OCR
+        return blocks.filter(r => r.querySelector('h3') && (r.innerText || '').trim()).map(r => ({
+            text: r.innerText,
+            links: Array.from(r.querySelectorAll('a[href]'), a => ({href: a.href, text: a.innerText}))
+        }));
+    }""")
+
+def _build_dom_result(page: Page, company_name: str, blocks: list) -> dict:
+    """Builds the same result structure as the OCR path from DOM result blocks"""
+    extracted_text = "\n\n".join(block['text'] for block in blocks)
+    extracted_data = extract_structured_info_from_text(extracted_text, company_name)
+    extracted_links = extract_links_visually(page)
+    
+    print(f"✅ DOM extraction completed: {len(blocks)} result blocks, skipping OCR")
+    print(f"📊 Extracted {len(extracted_data.get('results', []))} search results")
+    print(f"🔗 Extracted {len(extracted_links)} links")
+    
+    return {
+        'company_name': company_name,
+        'total_screenshots': 0,
+        'total_text_length': len(extracted_text),
+        'extracted_data': extracted_data,
+        'extracted_links': extracted_links,
+        'raw_text': _elide(extracted_text, 1000),
+        'ocr_method': 'dom'
+    }
+
+def decode_screenshot(screenshot: bytes) -> np.ndarray:
+    """Decodes PNG screenshot bytes into an RGB array without an intermediate copy"""
+    image = cv2.imdecode(np.frombuffer(screenshot, np.uint8), cv2.IMREAD_COLOR)
+    return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+def _save_debug_screenshot(path: str, screenshot: bytes):
+    """Re-encodes a PNG screenshot as JPEG and writes it to disk, logging instead of raising on failure"""
+    try:
+        image = cv2.imdecode(np.frombuffer(screenshot, np.uint8), cv2.IMREAD_COLOR)
+        ok, jpeg = cv2.imencode('.jpg', image, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        if not ok:
+            raise ValueError("JPEG encoding failed")
+        with open(path, "wb") as f:
+            f.write(jpeg.tobytes())
+    except (OSError, ValueError, cv2.error) as e:
+        print(f"⚠️  Could not save debug screenshot {path}: {e}")
+
+def capture_search_screenshot(page: Page, company_name: str) -> bytes:
+    """
+    Takes a single screenshot of a prepared Google search results page and returns the PNG bytes.
+    """
+    # Get page dimensions
+    try:
+        page_width = page.viewport_size['width']
+        page_height = page.viewport_size['height']
+    except (TypeError, KeyError):
+        # Set default viewport size if not available
+        page_width = 1920
+        page_height = 1080
+        print(f"⚠️  Using default viewport size: {page_width}x{page_height}")
+    
+    print(f"📏 Page dimensions: {page_width}x{page_height}")
+    
+    # Get the full page size
+    print("📜 Getting full page height...")
+    full_width, full_height = page.evaluate("""
+        () => {
+            return [
+                document.documentElement.scrollWidth,
+                Math.max(
+                    document.body.scrollHeight,
+                    document.documentElement.scrollHeight,
+                    document.body.offsetHeight,
+                    document.documentElement.offsetHeight
+                )
+            ];
+        }
+    """)
+    
+    print(f"📏 Full page height: {full_height}")
+    
+    # Take ONE screenshot of the top of the page; results below OCR_MAX_HEIGHT aren't worth the OCR cost
+    clip_height = min(full_height, OCR_MAX_HEIGHT)
+    print(f"📸 Taking screenshot of the top {clip_height}px...")
+    screenshot = page.screenshot(full_page=True, clip={'x': 0, 'y': 0, 'width': full_width, 'height': clip_height})
+    print("✅ Screenshot captured successfully!")
+    
+    # Save screenshot for debugging purposes in Screenshots folder
+    # Encoded and written in the background so it never delays OCR
+    if SAVE_DEBUG_SCREENSHOTS:
+        debug_screenshot_path = f"Screenshots/debug_screenshot_{company_name}_{int(time.time())}.jpg"
+        _debug_io_pool.submit(_save_debug_screenshot, debug_screenshot_path, screenshot)
+        print(f"💾 Saving screenshot for debugging: {debug_screenshot_path}")
+    
+    return screenshot
+
+def _text_from_ocr_page(doc_page) -> str:
+    """Joins the words docTR recognized on one page into text, one OCR line per text line"""
+    # Debug: Show what docTR detected
+    print(f"   {len(doc_page.blocks)} blocks, {sum(len(block.lines) for block in doc_page.blocks)} lines")
+    for j, block in enumerate(doc_page.blocks):
+        print(f"     Block {j+1}: {len(block.lines)} lines")
+        for k, line in enumerate(block.lines):
+            print(f"       Line {k+1}: {len(line.words)} words")
+            if len(line.words) > 0:
+                sample_words = [word.value for word in line.words[:3]]
+                print(f"         Sample words: {sample_words}")
+    
+    # Extract text from docTR results with better confidence handling
+    confidence_threshold = 0.1  # Lower threshold to get more text
+    extracted_text = _join_ocr_words(doc_page, confidence_threshold)
+    
+    # If we still get very little text, try again regardless of confidence
+    if len(extracted_text.strip()) < 100:
+        print("⚠️  Low text extraction, trying alternative method...")
+        extracted_text = _join_ocr_words(doc_page, 0.0)
+    
+    return extracted_text
+
+def _join_ocr_words(doc_page, min_confidence: float) -> str:
+    """Joins the words at or above min_confidence, one OCR line per text line and a blank line between blocks"""
+    lines = []
+    for block in doc_page.blocks:
+        for line in block.lines:
+            words = [word.value for word in line.words if getattr(word, 'confidence', 1.0) >= min_confidence]
+            if words:
+                lines.append(' '.join(words))
+        lines.append('')
+    return '\n'.join(lines)
+
+def _build_ocr_result(page: Page, company_name: str, extracted_text: str) -> dict:
+    """Turns the OCR text of one results page into the structured result returned to callers"""
+    if not extracted_text.strip():
+        print("❌ No text extracted from screenshot")
+        return {"error": "No text extracted from screenshot"}
+    
+    print(f"✅ Text extracted: {len(extracted_text)} characters")
+    
+    # Extract structured information from the text
+    extracted_data = extract_structured_info_from_text(extracted_text, company_name)
+    
+    # Extract links from the page using visual approach
+    extracted_links = extract_links_visually(page)
+    
+    print(f"✅ docTR OCR extraction completed successfully!")
+    print(f"📊 Extracted {len(extracted_data.get('results', []))} search results")
+    print(f"🔗 Extracted {len(extracted_links)} links")
+    
+    return {
+        'company_name': company_name,
+        'total_screenshots': 1,
+        'total_text_length': len(extracted_text),
+        'extracted_data': extracted_data,
+        'extracted_links': extracted_links,
+        'raw_text': _elide(extracted_text, 1000),
+        'ocr_method': 'docTR'
+    }
+
 def extract_search_data_with_ocr(page: Page, company_name: str) -> dict:
     """
-    Takes a single full-page screenshot and extracts all search information using OCR.
+    Extracts all search information from a Google search results page.
     This function focuses on extracting data from Google search results page 1.
+    Results are read straight from the DOM; a full-page screenshot is OCR'd only
+    when the DOM yields nothing (e.g. the results are masked).
     """
-    print(f"🔍 Starting OCR extraction for '{company_name}' search results...")
-    
+    return extract_search_data_with_ocr_batch([(page, company_name)])[0]
+
+def _ocr_screenshots(items: list, texts: dict, errors: dict):
+    """OCRs (index, company_name, screenshot) items in one docTR pass, reusing cached text where possible"""
     try:
-        # Wait for the page to fully load and handle any consent dialogs
-        page.wait_for_timeout(3000)
+        # Load the model first: cache keys carry the tag of the model that actually loaded
+        ocr_model = get_ocr_model()
         
-        # Handle captcha and consent dialogs first
-        if not handle_captcha_and_consent(page):
-            print("❌ Failed to handle captcha/consent dialogs")
-            return {"error": "Failed to handle captcha/consent"}
+        # Reuse OCR text for screenshots seen before, only run docTR on the rest
+        pending = []
+        for index, company_name, screenshot in items:
+            cached_text = ocr_cache.get(screenshot)
+            if cached_text is not None:
+                print(f"♻️  OCR cache hit for '{company_name}'")
+                texts[index] = cached_text
+            else:
+                pending.append((index, company_name, screenshot))
         
-        # Wait for search results to appear
-        try:
-            page.wait_for_selector('div.g', timeout=10000)
-            print("✅ Search results detected, proceeding with OCR...")
-        except:
-            print("⚠️  Search results selector not found, continuing anyway...")
+        if not pending:
+            return
         
-        # Get page dimensions
-        try:
-            page_width = page.viewport_size['width']
-            page_height = page.viewport_size['height']
-        except (TypeError, KeyError):
-            # Set default viewport size if not available
-            page_width = 1920
-            page_height = 1080
-            print(f"⚠️  Using default viewport size: {page_width}x{page_height}")
-        
-        print(f"📏 Page dimensions: {page_width}x{page_height}")
-        
-        # Get the full page height
-        print("📜 Getting full page height...")
-        full_height = page.evaluate("""
-            () => {
-                return Math.max(
-                    document.body.scrollHeight,
-                    document.documentElement.scrollHeight,
-                    document.body.offsetHeight,
-                    document.documentElement.offsetHeight
-                );
-            }
-        """)
+        if ocr_model is None:
+            for index, _, _ in pending:
+                errors[index] = "docTR OCR model not available"
+            return
         
-        print(f"📏 Full page height: {full_height}")
+        # Decode each PNG once, straight into the RGB arrays docTR consumes
+        doc = [decode_screenshot(screenshot) for _, _, screenshot in pending]
+        for image in doc:
+            print(f"📏 Screenshot dimensions: {image.shape[1]}x{image.shape[0]}")
         
-        # Take ONE full-page screenshot
-        print("📸 Taking full-page screenshot...")
-        screenshot = page.screenshot(full_page=True)
-        print("✅ Full-page screenshot captured successfully!")
+        # Extract text using docTR OCR
+        print(f"🔍 Running docTR OCR analysis on {len(pending)} screenshot(s)...")
+        with _ocr_inference_lock, _ocr_inference_context():
+            result = ocr_model(doc)
+        print(f"📊 docTR detected {len(result.pages)} page(s)")
+        
+        for (index, company_name, screenshot), doc_page in zip(pending, result.pages):
+            print(f"   Page for '{company_name}':")
+            texts[index] = _text_from_ocr_page(doc_page)
+            ocr_cache.set(screenshot, texts[index])
         
-        # Save screenshot for debugging purposes in Screenshots folder
-        debug_screenshot_path = f"Screenshots/debug_screenshot_{company_name}_{int(time.time())}.png"
-        with open(debug_screenshot_path, "wb") as f:
-            f.write(screenshot)
-        print(f"💾 Screenshot saved for debugging: {debug_screenshot_path}")
+        # zip stops at the shorter list if docTR returned fewer pages than it was given
+        for index, _, _ in pending:
+            if index not in texts:
+                errors[index] = "docTR returned no page for this screenshot"
+    
+    except Exception as e:
+        print(f"❌ Error processing screenshot with docTR: {e}")
+        for index, _, _ in items:
+            if index not in texts:
+                errors[index] = f"Error processing screenshot: {e}"
+
+def _ocr_consumer(work: queue.Queue, texts: dict, errors: dict):
+    """Pulls screenshots off the queue and OCRs them in batches until it receives None"""
+    done = False
+    while not done:
+        items = [work.get()]
+        # Take whatever else is already waiting, up to a full batch
+        while len(items) < OCR_BATCH_SIZE:
+            try:
+                items.append(work.get_nowait())
+            except queue.Empty:
+                break
         
-        # Process the single screenshot with docTR
+        done = None in items
+        items = [item for item in items if item is not None]
+        if not items:
+            continue
+        # Never let one bad batch end the thread: the capture side would block on a full queue
         try:
-            if ocr_model is None:
-                return {"error": "docTR OCR model not available"}
-            
-            # Convert screenshot to PIL Image
-            image = Image.open(io.BytesIO(screenshot))
-            print(f"📏 Screenshot dimensions: {image.size}")
-            
-            # Save image temporarily for docTR
-            temp_image_path = "temp_screenshot.png"
-            image.save(temp_image_path)
-            
-            # Create DocumentFile from the image
-            doc = DocumentFile.from_images([temp_image_path])
-            
-            # Extract text using docTR OCR
-            print("🔍 Running docTR OCR analysis...")
-            result = ocr_model(doc)
-            
-            # Debug: Show what docTR detected
-            print(f"📊 docTR detected {len(result.pages)} page(s)")
-            for i, doc_page in enumerate(result.pages):
-                print(f"   Page {i+1}: {len(doc_page.blocks)} blocks, {sum(len(block.lines) for block in doc_page.blocks)} lines")
-                for j, block in enumerate(doc_page.blocks):
-                    print(f"     Block {j+1}: {len(block.lines)} lines")
-                    for k, line in enumerate(block.lines):
-                        print(f"       Line {k+1}: {len(line.words)} words")
-                        if len(line.words) > 0:
-                            sample_words = [word.value for word in line.words[:3]]
-                            print(f"         Sample words: {sample_words}")
-            
-            # Extract text from docTR results with better confidence handling
-            extracted_text = ""
-            confidence_threshold = 0.1  # Lower threshold to get more text
-            
-            for doc_page in result.pages:
-                for block in doc_page.blocks:
-                    for line in block.lines:
-                        line_text = ""
-                        for word in line.words:
-                            # Include words with lower confidence to get more text
-                            if hasattr(word, 'confidence') and word.confidence < confidence_threshold:
-                                continue
-                            line_text += word.value + " "
-                        if line_text.strip():
-                            extracted_text += line_text.strip() + "\n"
-                    extracted_text += "\n"
-            
-            # If we still get very little text, try alternative extraction method
-            if len(extracted_text.strip()) < 100:
-                print("⚠️  Low text extraction, trying alternative method...")
-                # Try to get all text regardless of confidence
-                extracted_text = ""
-                for doc_page in result.pages:
-                    for block in doc_page.blocks:
-                        for line in block.lines:
-                            for word in line.words:
-                                extracted_text += word.value + " "
-                            extracted_text += "\n"
-                        extracted_text += "\n"
+            _ocr_screenshots(items, texts, errors)
+        except Exception as e:
+            print(f"❌ OCR thread error: {e}")
+            for index, _, _ in items:
+                if index not in texts:
+                    errors.setdefault(index, f"Error processing screenshot: {e}")
+
+def extract_search_data_with_ocr_batch(pages: list[tuple[Page, str]]) -> list[dict]:
+    """
+    Extracts several Google search result pages, reading the DOM directly where possible
+    and OCRing the remaining screenshots on a background thread while the next pages are captured.
+    Returns one result dict per (page, company_name) pair, in input order.
+    """
+    results = [None] * len(pages)
+    batch = []
+    
+    # Playwright stays on this thread; the OCR thread only sees screenshot bytes
+    work = queue.Queue(maxsize=OCR_QUEUE_SIZE)
+    texts = {}
+    errors = {}
+    consumer = None
+    
+    for index, (page, company_name) in enumerate(pages):
+        print(f"🔍 Starting extraction for '{company_name}' search results...")
+        try:
+            if not prepare_search_page(page):
+                results[index] = {"error": "Failed to handle captcha/consent"}
+                continue
             
-            # Clean up temporary file
-            try:
-                os.remove(temp_image_path)
-            except:
-                pass
+            # Fast path: the results are already text in the DOM
+            blocks = extract_dom_fast(page)
+            if blocks:
+                results[index] = _build_dom_result(page, company_name, blocks)
+                continue
             
-            if extracted_text.strip():
-                print(f"✅ Text extracted: {len(extracted_text)} characters")
-                
-                # Extract structured information from the text
-                extracted_data = extract_structured_info_from_text(extracted_text, company_name)
-                
-                # Extract links from the page using visual approach
-                extracted_links = extract_links_visually(page)
-                
-                print(f"✅ docTR OCR extraction completed successfully!")
-                print(f"📊 Extracted {len(extracted_data.get('results', []))} search results")
-                print(f"🔗 Extracted {len(extracted_links)} links")
-                
-                return {
-                    'company_name': company_name,
-                    'total_screenshots': 1,
-                    'total_text_length': len(extracted_text),
-                    'extracted_data': extracted_data,
-                    'extracted_links': extracted_links,
-                    'raw_text': extracted_text[:1000] + "..." if len(extracted_text) > 1000 else extracted_text,
-                    'ocr_method': 'docTR'
-                }
-            else:
-                print("❌ No text extracted from screenshot")
-                return {"error": "No text extracted from screenshot"}
-                
+            print("⚠️  No result blocks in the DOM, falling back to OCR...")
+            screenshot = capture_search_screenshot(page, company_name)
         except Exception as e:
-            print(f"❌ Error processing screenshot with docTR: {e}")
-            return {"error": f"Error processing screenshot: {e}"}
+            print(f"❌ Error during OCR extraction: {e}")
+            results[index] = {"error": str(e)}
+            continue
         
-    except Exception as e:
-        print(f"❌ Error during OCR extraction: {e}")
-        return {"error": str(e)}
+        if consumer is None:
+            consumer = threading.Thread(target=_ocr_consumer, args=(work, texts, errors), daemon=True)
+            consumer.start()
+        work.put((index, company_name, screenshot))
+        batch.append((index, page, company_name))
+    
+    if consumer is None:
+        return results
+    
+    work.put(None)
+    consumer.join()
+    
+    for index, page, company_name in batch:
+        if index in errors:
+            results[index] = {"error": errors[index]}
+            continue
+        if index not in texts:
+            results[index] = {"error": "No OCR text was produced for this page"}
+            continue
+        try:
+            results[index] = _build_ocr_result(page, company_name, texts[index])
+        except Exception as e:
+            print(f"❌ Error during OCR extraction: {e}")
+            results[index] = {"error": str(e)}
+    
+    # Callers check '"error" in result', so every slot must hold a dict
+    return [result if result is not None else {"error": "Page was not extracted"} for result in results]
 
 def extract_links_visually(browser_page: Page) -> list:
-    """Extract links by finding blue text and hovering to get URLs - much more reliable than CSS selectors!"""
-    print("🔗 Extracting links using visual approach...")
+    """Extract every outbound link on the results page in a single round-trip and classify it"""
+    print("🔗 Extracting links from the page...")
     
     try:
         # Wait for page to fully load
         print("    ⏳ Waiting for page to load completely...")
-        time.sleep(3)
+        wait_for_network_idle(browser_page)
         
         # Debug: Check page content
         print("    🔍 Checking page content...")
@@ -505,181 +1249,74 @@ def extract_links_visually(browser_page: Page) -> list:
         except:
             pass
         
-        # Strategy 1: Find elements with blue text (Google's standard link color)
-        print("    🎨 Looking for social media and email links...")
-        blue_selectors = [
-            'a[style*="color: rgb(26, 13, 171)"]',  # Google's blue link color
-            'a[style*="color: #1a0dab"]',            # Hex version
-            'a[style*="color: rgb(26, 13, 171)"]',  # RGB version
-            'a[class*="link"]',                      # Generic link classes
-            'a[href]'                                # Fallback to any link
-        ]
+        # Read every link's URL, text and title inside the browser at once
+        raw_links = browser_page.evaluate("""() => Array.from(document.querySelectorAll('a[href]'), a => ({
+            href: a.href,
+            text: (a.innerText || '').trim(),
+            title: a.title || ''
+        }))""")
+        print(f"    Found {len(raw_links)} links on the page")
         
-        all_links = []
-        for selector in blue_selectors:
-            try:
-                elements = browser_page.locator(selector).all()
-                if elements:
-                    print(f"    Found {len(elements)} elements with selector: {selector}")
-                    for element in elements:
-                        try:
-                            # Get the text content
-                            text = element.inner_text().strip()
-                            if text and len(text) > 3:  # Only meaningful text
-                                
-                                # Get the href attribute directly (no need to hover)
-                                href = element.get_attribute('href')
-                                
-                                # Only keep social media and email links
-                                if href and href.startswith('http') and 'google.com' not in href:
-                                    # Check if it's a social media profile or email
-                                    is_social_or_email = any(site in href.lower() for site in [
-                                        'linkedin.com/in/', 'instagram.com/', 'twitter.com/', 'x.com/',
-                                        'facebook.com/', 'youtube.com/', 'tiktok.com/'
-                                    ]) or '@' in href
-                                    
-                                    if is_social_or_email:
-                                        all_links.append({
-                                            'text': text,
-                                            'url': href,
-                                            'element': element
-                                        })
-                                    
-                        except Exception as e:
-                            continue
-                            
-            except Exception as e:
+        # Keep meaningful outbound links, first occurrence of each URL only
+        extracted_links = []
+        seen_urls = set()
+        for link in raw_links:
+            url = link['href']
+            text = link['text']
+            if not text or len(text) <= 3 or not url.startswith('http') or 'google.com' in url:
                 continue
-        
-        # Strategy 2: Find any clickable elements by looking for cursor changes
-        print("    🖱️  Looking for clickable elements...")
-        try:
-            # Find elements that change cursor on hover
-            clickable_elements = browser_page.locator('a[href], button, [role="button"], [tabindex]').all()
-            print(f"    Found {len(clickable_elements)} potentially clickable elements")
-            
-            for element in clickable_elements:
-                try:
-                    # Get the text content
-                    text = element.inner_text().strip()
-                    if text and len(text) > 3:
-                        
-                        # Get href if it's a link (no need to hover)
-                        href = element.get_attribute('href')
-                        if href and href.startswith('http') and 'google.com' not in href:
-                            # Check if we already have this URL
-                            if not any(link['url'] == href for link in all_links):
-                                all_links.append({
-                                    'text': text,
-                                    'url': href,
-                                    'element': element
-                                })
-                                
-                except Exception as e:
-                    continue
-                    
-        except Exception as e:
-            print(f"    ⚠️  Error in clickable element detection: {e}")
-        
-        # Strategy 3: Look for URL patterns in the page content
-        print("    🔍 Looking for URL patterns in page content...")
-        try:
-            page_content = browser_page.content()
-            # Simple regex to find URLs
-            import re
-            url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-            urls_in_content = re.findall(url_pattern, page_content)
-            
-            print(f"    Found {len(urls_in_content)} URLs in page content")
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
             
-            # Filter out Google URLs and duplicates
-            unique_urls = []
-            for url in urls_in_content:
-                if 'google.com' not in url and url not in unique_urls:
-                    unique_urls.append(url)
+            # Classify the link type with a single regex scan
+            match = SOCIAL_LINK_RE.search(url)
+            if match:
+                platform = _SOCIAL_KIND_PLATFORM.get(match.group(1), PLATFORM_SOCIAL)
+            else:
+                platform = PLATFORM_EMAIL if '@' in url else PLATFORM_OTHER
             
-            # Try to find the text associated with these URLs
-            for url in unique_urls[:10]:  # Limit to first 10
-                try:
-                    # Look for elements that might contain this URL
-                    url_elements = browser_page.locator(f'a[href*="{url.split("//")[1].split("/")[0]}"]').all()
-                    for element in url_elements:
-                        text = element.inner_text().strip()
-                        if text and len(text) > 3:
-                            if not any(link['url'] == url for link in all_links):
-                                all_links.append({
-                                    'text': text,
-                                    'url': url,
-                                    'element': element
-                                })
-                                break
-                except:
-                    continue
-                    
-        except Exception as e:
-            print(f"    ⚠️  Error in URL pattern detection: {e}")
+            extracted_links.append({
+                'url': url,
+                'text': text,
+                'title': link['title'],
+                'platform': platform
+            })
         
-        print(f"    📊 Total potential links found: {len(all_links)}")
+        # Social media and email links first, as before
+        extracted_links.sort(key=lambda link: link['platform'] == PLATFORM_OTHER)
         
-        # Extract final link information
-        extracted_links = []
-        for link in all_links:
-            try:
-                                 # Classify the link type
-                 is_linkedin = 'linkedin.com/in/' in link['url']
-                 is_instagram = 'instagram.com/' in link['url']
-                 is_twitter = 'twitter.com/' in link['url'] or 'x.com/' in link['url']
-                 is_email = '@' in link['url']
-                 is_social = any(site in link['url'] for site in ['linkedin.com/in/', 'instagram.com/', 'twitter.com/', 'x.com/', 'facebook.com/', 'youtube.com/', 'tiktok.com/'])
-                 
-                 extracted_links.append({
-                     'url': link['url'],
-                     'text': link['text'],
-                     'title': '',  # Could be enhanced later
-                     'is_linkedin': is_linkedin,
-                     'is_instagram': is_instagram,
-                     'is_twitter': is_twitter,
-                     'is_email': is_email,
-                     'is_social': is_social
-                 })
-            except Exception as e:
-                continue
-        
-        # Remove duplicates based on URL
-        unique_links = []
-        seen_urls = set()
-        for link in extracted_links:
-            if link['url'] not in seen_urls:
-                unique_links.append(link)
-                seen_urls.add(link['url'])
-        
-        print(f"✅ Extracted {len(unique_links)} unique links using visual approach")
+        print(f"✅ Extracted {len(extracted_links)} unique links")
         
         # Debug: Show some sample links
-        if unique_links:
+        if extracted_links:
             print("    📋 Sample links:")
-            for i, link in enumerate(unique_links[:5]):
-                profile_icon = "👤" if link['is_profile'] else "🔗"
-                print(f"      {i+1}. {profile_icon} {link['text'][:50]}... -> {link['url']}")
+            for i, link in enumerate(extracted_links[:5]):
+                profile_icon = "👤" if link['platform'] in SOCIAL_PLATFORMS else "🔗"
+                print(f"      {i+1}. {profile_icon} {_elide(link['text'], 50)} -> {link['url']}")
         
-        return unique_links
+        return extracted_links
         
     except Exception as e:
-        print(f"❌ Error in visual link extraction: {e}")
+        print(f"❌ Error in link extraction: {e}")
         return []
 
-def extract_structured_info_from_text(text: str, company_name: str) -> dict:
-    """
-    Extracts structured information from OCR text.
-    Parses Google search results to find company names, titles, and other relevant information.
-    """
-    print("🔍 Parsing extracted text for structured information...")
-    
+# Job titles that mark a line as describing a decision-maker
+TITLE_RE = re.compile(r'\b(?:ceo|founder|cto|cfo|coo|president|director|manager)\b', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=256)
+def _parse_search_text(text: str, company_name: str) -> tuple:
+    """Immutable parse of OCR text: one (company, title, description) tuple per result, memoized"""
     lines = text.split('\n')
-    results = []
+    # At most one result per line, so the list never has to grow
+    results = [None] * len(lines)
+    n = 0
+    company_re = re.compile(re.escape(company_name), re.IGNORECASE)
     
     # Look for patterns that indicate search results
-    current_result = {}
+    current_result = None
+    # Only the first long line after a company line becomes its description
+    need_desc = False
     
     for line in lines:
         line = line.strip()
@@ -687,42 +1324,66 @@ def extract_structured_info_from_text(text: str, company_name: str) -> dict:
             continue
             
         # Look for company names or titles
-        if company_name.lower() in line.lower():
+        if company_re.search(line):
             if current_result:
-                results.append(current_result)
-            current_result = {'company': line, 'title': '', 'description': ''}
+                results[n] = tuple(current_result)
+                n += 1
+            current_result = [line, '', '']
+            need_desc = True
             
         # Look for titles (CEO, Founder, CTO, etc.)
-        elif any(title in line.lower() for title in ['ceo', 'founder', 'cto', 'cfo', 'coo', 'president', 'director', 'manager']):
+        elif TITLE_RE.search(line):
             if current_result:
-                current_result['title'] = line
+                current_result[1] = line
                 
         # Look for descriptions or additional info
-        elif len(line) > 20 and not current_result.get('description'):
-            if current_result:
-                current_result['description'] = line
+        elif need_desc and len(line) > 20:
+            current_result[2] = line
+            need_desc = False
     
     # Add the last result if it exists
     if current_result:
-        results.append(current_result)
+        results[n] = tuple(current_result)
+        n += 1
     
-    # If no structured results found, try to extract any company-related information
-    if not results:
-        company_mentions = []
-        for line in lines:
-            if company_name.lower() in line.lower():
-                company_mentions.append(line)
-        
-        if company_mentions:
-            results = [{'company': mention, 'title': '', 'description': ''} for mention in company_mentions]
+    return tuple(results[:n])
+
+def extract_structured_info_from_text(text: str, company_name: str) -> dict:
+    """
+    Extracts structured information from OCR text.
+    Parses Google search results to find company names, titles, and other relevant information.
+    """
+    print("🔍 Parsing extracted text for structured information...")
     
+    # The parse is cached as tuples; callers get fresh dicts they are free to modify
+    parsed = _parse_search_text(text, company_name)
     return {
-        'results': results,
-        'total_results': len(results),
+        'results': [{'company': company, 'title': title, 'description': description}
+                    for company, title, description in parsed],
+        'total_results': len(parsed),
         'company_name': company_name
     }
 
-def create_browser_context(playwright, use_proxy=False, proxy_url=None):
+# Stealth patches injected into every page; whitespace is collapsed once at import to keep the payload small
+_STEALTH_JS = " ".join("""
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+    
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+    
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en'],
+    });
+    
+    window.chrome = {
+        runtime: {},
+    };
+""".split())
+
+def create_browser_context(playwright, use_proxy=False, proxy_url=None, storage_state=None):
     """Create a browser context with anti-detection measures"""
     
     # Browser launch options
@@ -748,15 +1409,7 @@ def create_browser_context(playwright, use_proxy=False, proxy_url=None):
     # Context options
     context_options = {
         "no_viewport": True,
-        "user_agent": random.choice(USER_AGENTS),
-        "extra_http_headers": {
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1"
-        }
+        **_RNG.choice(UA_PROFILES)
     }
     
     # Add proxy if specified
@@ -764,53 +1417,53 @@ def create_browser_context(playwright, use_proxy=False, proxy_url=None):
         context_options["proxy"] = {"server": proxy_url}
         print(f"🔒 Using proxy: {proxy_url}")
     
+    # Restore cookies and local storage saved by a previous session
+    if storage_state and os.path.exists(storage_state):
+        context_options["storage_state"] = storage_state
+        print(f"🍪 Restoring browser state from {storage_state}")
+    
     context = browser.new_context(**context_options)
     
     # Add stealth scripts
-    context.add_init_script("""
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-        });
-        
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3, 4, 5],
-        });
-        
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en'],
-        });
-        
-        window.chrome = {
-            runtime: {},
-        };
-    """)
+    context.add_init_script(_STEALTH_JS)
     
     return browser, context
 
 # --- Main Functions ---
 
+VALID_SAMESITE = frozenset({'Strict', 'Lax', 'None'})
+REQUIRED_COOKIE_FIELDS = ('name', 'value', 'domain')
+
+# Validated cookies per file, reused until the file's mtime changes
+_cookie_cache = {}
+
+def _fix_cookie(cookie: dict) -> dict:
+    """Default an invalid sameSite value to Lax"""
+    if 'sameSite' in cookie and cookie['sameSite'] not in VALID_SAMESITE:
+        cookie['sameSite'] = 'Lax'
+    return cookie
+
 def load_cookies(context: BrowserContext, cookie_file_path: str):
     """Loads cookies from a file into the browser context."""
-    if not os.path.exists(cookie_file_path):
+    try:
+        mtime = os.path.getmtime(cookie_file_path)
+    except OSError:
         print(f"Warning: Cookie file not found at {cookie_file_path}. Proceeding without them.")
         return
     try:
-        with open(cookie_file_path, 'r') as f:
-            cookies = json.load(f)
-        
-        # Fix cookie format issues
-        fixed_cookies = []
-        for cookie in cookies:
-            # Fix sameSite field if it's invalid
-            if 'sameSite' in cookie:
-                if cookie['sameSite'] not in ['Strict', 'Lax', 'None']:
-                    cookie['sameSite'] = 'Lax'  # Default to Lax
+        cached = _cookie_cache.get(cookie_file_path)
+        if cached and cached[0] == mtime:
+            fixed_cookies = cached[1]
+        else:
+            with open(cookie_file_path, 'r') as f:
+                cookies = json.load(f)
             
-            # Ensure required fields exist
-            if 'name' in cookie and 'value' in cookie and 'domain' in cookie:
-                fixed_cookies.append(cookie)
-            else:
-                print(f"⚠️  Skipping invalid cookie: {cookie.get('name', 'unknown')}")
+            # Fix cookie format issues and drop entries missing required fields
+            fixed_cookies = [_fix_cookie(c) for c in cookies if all(k in c for k in REQUIRED_COOKIE_FIELDS)]
+            invalid = len(cookies) - len(fixed_cookies)
+            if invalid:
+                print(f"⚠️  Skipped {invalid} invalid cookies")
+            _cookie_cache[cookie_file_path] = (mtime, fixed_cookies)
         
         if fixed_cookies:
             context.add_cookies(fixed_cookies)
@@ -822,6 +1475,32 @@ def load_cookies(context: BrowserContext, cookie_file_path: str):
         print(f"Error loading cookies from {cookie_file_path}: {e}")
         print("Continuing without cookies...")
 
+def migrate_cookies_to_storage_state(context: BrowserContext, cookie_file_path: str, state_path: str):
+    """One-time conversion of an exported cookie file into a Playwright storage_state file."""
+    if os.path.exists(state_path) or not os.path.exists(cookie_file_path):
+        return
+    load_cookies(context, cookie_file_path)
+    try:
+        context.storage_state(path=state_path)
+        print(f"💾 Saved browser state to {state_path}")
+    except Exception as e:
+        print(f"⚠️  Could not save browser state to {state_path}: {e}")
+
+def reset_context_state(context: BrowserContext, state_path: str):
+    """Swap a context's cookies back to a saved storage_state in place, without bootstrapping a new context."""
+    try:
+        with open(state_path, 'r') as f:
+            cookies = json.load(f).get('cookies')
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"⚠️  Could not read browser state from {state_path}, keeping current cookies: {e}")
+        return
+    if not isinstance(cookies, list) or not cookies:
+        print(f"⚠️  No cookies in {state_path}, keeping current cookies")
+        return
+    # Only drop the live session once the replacement is known to be usable
+    context.clear_cookies()
+    context.add_cookies(cookies)
+
 def scrape_linkedin_profile(page: Page, profile_url: str) -> dict:
     """Navigates to a LinkedIn profile and scrapes key information."""
     print(f"Scraping LinkedIn profile: {profile_url}")
@@ -830,18 +1509,22 @@ def scrape_linkedin_profile(page: Page, profile_url: str) -> dict:
         page.goto(profile_url, wait_until="domcontentloaded", timeout=60000)
         
         # Wait for the main profile element to ensure the page is loaded
-        page.wait_for_selector('h1', timeout=15000)
+        page.wait_for_selector('h1.text-heading-xlarge', state='visible', timeout=15000)
 
-        # Scrape the data using specific selectors (these might need updating if LinkedIn changes its layout)
-        name = page.locator('h1').first.inner_text().strip()
-        headline = page.locator('div.text-body-medium.break-words').first.inner_text().strip()
-        
-        # Add more selectors for location, company, etc. if needed
+        # Scrape all fields in one round-trip (these selectors might need updating if LinkedIn changes its layout)
+        profile_data = page.evaluate("""() => {
+            const text = (selector) => document.querySelector(selector)?.innerText.trim() ?? '';
+            return {
+                name: text('h1'),
+                headline: text('div.text-body-medium.break-words'),
+                location: text('span.text-body-small.inline'),
+                company: text('[aria-label="Current company"]')
+            };
+        }""")
         
         scraped_data = {
             "url": profile_url,
-            "name": name,
-            "headline": headline
+            **profile_data
         }
         
         return scraped_data
@@ -850,148 +1533,248 @@ def scrape_linkedin_profile(page: Page, profile_url: str) -> dict:
         print(f"  -> Failed to scrape {profile_url}: {e}")
         return {"url": profile_url, "error": str(e)}
 
-# --- Main Execution Block ---
-if __name__ == "__main__":
-    # The company you want to target
-    target_company = "OpenAI" 
-
-    all_leads_data = []
+def _linkedin_worker(url_queue: queue.Queue, results: dict):
+    """Scrape profiles from the shared queue until it is empty.
 
+    Playwright's sync API binds every object to the thread that created it, so each
+    worker owns its own driver, browser and context instead of borrowing one.
+    """
     with sync_playwright() as p:
-        # Create browser with anti-detection measures
-        browser, context = create_browser_context(p)
-        
-        # --- Step 1: Google Search with OCR Extraction ---
-        print("--- Phase 1: Google Search with OCR Data Extraction ---")
-        google_page = context.new_page()
-        load_cookies(context, GOOGLE_COOKIES_PATH)
-        
-        # Navigate to Google search with targeted social media and email queries
-        # Focus ONLY on social profiles and contact information
-        search_queries = [
-            # Social Media Profiles
-            f'"{target_company}" CEO OR founder OR executive site:linkedin.com/in/',
-            f'"{target_company}" CEO OR founder OR executive site:instagram.com/',
-            f'"{target_company}" CEO OR founder OR executive site:twitter.com/',
-            f'"{target_company}" CEO OR founder OR executive site:x.com/',
-            
-            # Contact Information
-            f'"{target_company}" email OR contact OR "@"',
-            f'"{target_company}" contact@ OR info@ OR hello@ OR support@'
-        ]
-        
-        all_leads_data = []
+        browser, context = create_browser_context(p, storage_state=LINKEDIN_STATE_PATH)
+        install_resource_blocker(context, LINKEDIN_BLOCKED_RESOURCES)
+        page = context.new_page()
+        uses = 0
         
-        # Process each search query with short delays
-        for query_num, search_query in enumerate(search_queries, 1):
-            print(f"\n🔍 Search Query {query_num}/{len(search_queries)}: {search_query}")
-            print(f"📊 Executing targeted social media and email search...")
-            
-            try:
-                google_page.goto(f"https://www.google.com/search?q={search_query}", wait_until="domcontentloaded")
-                
-                # Add HUMAN-LIKE page interaction before OCR
-                print("👤 Simulating human page interaction...")
-                
-                # Random scroll down and up (like reading)
-                scroll_down = random.randint(2, 5)
-                for _ in range(scroll_down):
-                    google_page.evaluate("window.scrollBy(0, 300)")
-                    time.sleep(random.uniform(0.5, 1.5))
-                
-                # Random scroll back up
-                scroll_up = random.randint(1, 3)
-                for _ in range(scroll_up):
-                    google_page.evaluate("window.scrollBy(0, -200)")
-                    time.sleep(random.uniform(0.3, 1.0))
+        try:
+            while True:
+                try:
+                    index, profile_url = url_queue.get_nowait()
+                except queue.Empty:
+                    break
                 
-                # Random mouse movement simulation
-                print("🖱️  Simulating natural mouse movements...")
-                time.sleep(random.uniform(2, 4))
+                results[index] = scrape_linkedin_profile(page, profile_url)
+                uses += 1
                 
-                # Extract data using OCR
-                ocr_results = extract_search_data_with_ocr(google_page, target_company)
+                # Recycle the context once it has served enough profiles
+                if uses >= MAX_USES_PER_INSTANCE:
+                    page.close()
+                    reset_context_state(context, LINKEDIN_STATE_PATH)
+                    page = context.new_page()
+                    uses = 0
                 
-                if "error" not in ocr_results:
-                    print("✅ OCR extraction successful!")
-                    print(f"📊 Found {ocr_results['total_screenshots']} screenshots")
-                    print(f"📝 Extracted {ocr_results['total_text_length']} characters of text")
-                    print(f"🏢 Found {ocr_results['extracted_data']['total_results']} potential results")
-                    print(f"🔗 Found {len(ocr_results.get('extracted_links', []))} links")
-                    
-                    # Display extracted results
-                    print("\n📋 Extracted Information:")
-                    for j, result in enumerate(ocr_results['extracted_data']['results'], 1):
-                        print(f"  {j}. Company: {result.get('company', 'N/A')}")
-                        print(f"     Title: {result.get('title', 'N/A')}")
-                        print(f"     Description: {result.get('description', 'N/A')}")
-                        print()
-                    
-                    # Display extracted links
-                    if ocr_results.get('extracted_links'):
-                        print("🔗 Extracted Social Media & Email Links:")
-                        for j, link in enumerate(ocr_results['extracted_links'][:10], 1):  # Show first 10 links
-                            # Choose appropriate icon based on link type
-                            if link['is_linkedin']:
-                                icon = "💼 LinkedIn"
-                            elif link['is_instagram']:
-                                icon = "📸 Instagram"
-                            elif link['is_twitter']:
-                                icon = "🐦 X/Twitter"
-                            elif link['is_email']:
-                                icon = "📧 Email"
-                            elif link['is_social']:
-                                icon = "🌐 Social"
-                            else:
-                                icon = "🔗 Link"
-                            
-                            print(f"  {j}. {icon}: {link['text'][:50]}...")
-                            print(f"     {link['url']}")
-                            if link['title']:
-                                print(f"     📝 {link['title'][:100]}...")
-                            print()
-                    
-                    all_leads_data.append(ocr_results)
-                else:
-                    print(f"❌ OCR extraction failed: {ocr_results['error']}")
-                    
+                # Per-worker jittered backoff instead of one global pause
+                if not url_queue.empty():
+                    page.wait_for_timeout(random.uniform(1000, 2500))
+        finally:
+            browser.close()
+
+def scrape_linkedin_profiles(profile_urls: list[str], pool_size: int = LINKEDIN_POOL_SIZE) -> list[dict]:
+    """Scrapes LinkedIn profiles concurrently and returns results in input order."""
+    if not profile_urls:
+        return []
+    
+    url_queue = queue.Queue()
+    for index, profile_url in enumerate(profile_urls):
+        url_queue.put((index, profile_url))
+    
+    results = {}
+    workers = max(1, min(pool_size, len(profile_urls)))
+    print(f"👥 Scraping {len(profile_urls)} LinkedIn profiles with {workers} parallel browsers...")
+    
+    # Convert an exported cookie file once, before the workers restore their state from it
+    if not os.path.exists(LINKEDIN_STATE_PATH) and os.path.exists(LINKEDIN_COOKIES_PATH):
+        with sync_playwright() as p:
+            browser, context = create_browser_context(p)
+            migrate_cookies_to_storage_state(context, LINKEDIN_COOKIES_PATH, LINKEDIN_STATE_PATH)
+            browser.close()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_linkedin_worker, url_queue, results) for _ in range(workers)]
+        for future in futures:
+            try:
+                future.result()
             except Exception as e:
-                print(f"❌ Error during search query {query_num}: {e}")
-                continue
+                print(f"⚠️  LinkedIn worker failed: {e}")
+    
+    return [results.get(index, {"url": url, "error": "Not scraped"}) for index, url in enumerate(profile_urls)]
+
+# --- Main Execution Block ---
+# Google's captcha ("unusual traffic") page markers
+CAPTCHA_SELECTOR = '#captcha-form, form[action*="sorry"], iframe[src*="recaptcha"]'
+
+def wait_unless_captcha(page: Page, seconds: float):
+    """Pause between queries on the page's event loop, ending early if a captcha shows up"""
+    try:
+        page.wait_for_selector(CAPTCHA_SELECTOR, state='attached', timeout=seconds * 1000)
+        print("🤖 Captcha detected while waiting, continuing to the next query right away...")
+    except PlaywrightTimeoutError:
+        pass
+
+def build_lead_queries(company_name: str) -> list[str]:
+    """Google queries targeting social profiles and contact information for a company"""
+    return [
+        # Social Media Profiles
+        f'"{company_name}" CEO OR founder OR executive site:linkedin.com/in/',
+        f'"{company_name}" CEO OR founder OR executive site:instagram.com/',
+        f'"{company_name}" CEO OR founder OR executive site:twitter.com/',
+        f'"{company_name}" CEO OR founder OR executive site:x.com/',
+        
+        # Contact Information
+        f'"{company_name}" email OR contact OR "@"',
+        f'"{company_name}" contact@ OR info@ OR hello@ OR support@'
+    ]
+
+def run_lead_query(google_page: Page, company_name: str, search_query: str) -> dict:
+    """Runs one search query, extracts the results page and prints what was found. Returns None on failure."""
+    submit_search(google_page, search_query)
+    
+    # Add HUMAN-LIKE page interaction before OCR
+    print("👤 Simulating human page interaction...")
+    
+    # Random scroll down and back up (like reading), played back in one browser call
+    scroll_plan = build_scroll_plan()
+    google_page.evaluate(SCROLL_PLAN_JS, scroll_plan)
+    
+    # Random mouse movement simulation
+    print("🖱️  Simulating natural mouse movements...")
+    lead_query_rate_limiter.wait()
+    
+    # Extract data using OCR
+    ocr_results = extract_search_data_with_ocr(google_page, company_name)
+    
+    if "error" in ocr_results:
+        print(f"❌ OCR extraction failed: {ocr_results['error']}")
+        return None
+    
+    print("✅ OCR extraction successful!")
+    print(f"📊 Found {ocr_results['total_screenshots']} screenshots")
+    print(f"📝 Extracted {ocr_results['total_text_length']} characters of text")
+    print(f"🏢 Found {ocr_results['extracted_data']['total_results']} potential results")
+    print(f"🔗 Found {len(ocr_results.get('extracted_links', []))} links")
+    
+    # Display extracted results
+    print("\n📋 Extracted Information:")
+    for j, result in enumerate(ocr_results['extracted_data']['results'], 1):
+        print(f"  {j}. Company: {result.get('company', 'N/A')}")
+        print(f"     Title: {result.get('title', 'N/A')}")
+        print(f"     Description: {result.get('description', 'N/A')}")
+        print()
+    
+    # Display extracted links
+    if ocr_results.get('extracted_links'):
+        print("🔗 Extracted Social Media & Email Links:")
+        for j, link in enumerate(ocr_results['extracted_links'][:10], 1):  # Show first 10 links
+            # Choose appropriate icon based on link type
+            icon = _ICONS[link['platform']]
+            
+            print(f"  {j}. {icon}: {_elide(link['text'], 50)}")
+            print(f"     {link['url']}")
+            if link['title']:
+                print(f"     📝 {_elide(link['title'], 100)}")
+            print()
+    
+    return ocr_results
+
+def _lead_search_worker(company_name: str, queries: list[tuple[int, str]], total_queries: int) -> list[tuple[int, dict]]:
+    """Runs a share of the lead queries in its own browser; sync Playwright objects can't cross threads"""
+    results = []
+    with sync_playwright() as p:
+        # Create browser with anti-detection measures
+        browser, context = create_browser_context(p, storage_state=GOOGLE_STATE_PATH)
+        install_static_asset_cache(context)
+        # Registered last so it runs first: blocked requests never reach the asset cache
+        install_resource_blocker(context, GOOGLE_BLOCKED_RESOURCES)
+        try:
+            google_page = context.new_page()
             
-            # Add short delays between queries (5-8 seconds)
-            if query_num < len(search_queries):
-                delay = random.uniform(5, 8)
-                print(f"⏳ Waiting {delay:.1f} seconds before next query...")
-                time.sleep(delay)
-        
-        # --- Step 2: Display Final Results ---
-        print("\n--- Final Results Summary ---")
-        if all_leads_data:
-            print("✅ Data extraction completed successfully!")
-            print(f"📊 Total searches executed: {len(all_leads_data)}")
-            # Count total unique links
-            all_urls = set()
-            for data in all_leads_data:
-                for link in data.get('extracted_links', []):
-                    all_urls.add(link['url'])
-            print(f"🔗 Total unique links found: {len(all_urls)}")
-            print(f"📝 Total text extracted: {sum(data.get('total_text_length', 0) for data in all_leads_data)} characters")
+            for position, (query_num, search_query) in enumerate(queries):
+                # Keep this browser's own request rate human-like (5-8 seconds between its queries)
+                if position > 0:
+                    delay = random.uniform(5, 8)
+                    print(f"⏳ Waiting {delay:.1f} seconds before next query...")
+                    wait_unless_captcha(google_page, delay)
+                
+                print(f"\n🔍 Search Query {query_num}/{total_queries}: {search_query}")
+                print(f"📊 Executing targeted social media and email search...")
+                try:
+                    ocr_results = run_lead_query(google_page, company_name, search_query)
+                    if ocr_results is not None:
+                        results.append((query_num, ocr_results))
+                except Exception as e:
+                    print(f"❌ Error during search query {query_num}: {e}")
             
-            # Display summary of all results
-            print("\n📋 Summary of All Extracted Data:")
-            for i, data in enumerate(all_leads_data, 1):
-                print(f"  Search {i}: {data.get('extracted_data', {}).get('total_results', 0)} results, {len(data.get('extracted_links', []))} links")
+            google_page.close()
             
-            print("\n📄 Full JSON Results:")
-            print(json.dumps(all_leads_data, indent=2))
-        else:
-            print("❌ No data was extracted from any search queries.")
+            # Save the refreshed session so the next run starts warm
+            save_google_state(context)
+        finally:
+            browser.close()
+    return results
+
+def search_leads_parallel(company_name: str, workers: int = LEAD_SEARCH_WORKERS) -> list[dict]:
+    """Spreads the lead queries over several browsers and returns the successful results in query order"""
+    search_queries = list(enumerate(build_lead_queries(company_name), 1))
+    workers = max(1, min(workers, len(search_queries)))
+    
+    # Convert an exported cookie file once, before the workers restore their state from it
+    if not os.path.exists(GOOGLE_STATE_PATH) and os.path.exists(GOOGLE_COOKIES_PATH):
+        with sync_playwright() as p:
+            browser, context = create_browser_context(p)
+            migrate_cookies_to_storage_state(context, GOOGLE_COOKIES_PATH, GOOGLE_STATE_PATH)
+            browser.close()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_lead_search_worker, company_name, search_queries[i::workers], len(search_queries))
+            for i in range(workers)
+        ]
+        results = []
+        for future in futures:
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                print(f"⚠️  Lead search worker failed: {e}")
+    
+    results.sort(key=lambda item: item[0])
+    return [ocr_results for _, ocr_results in results]
+
+if __name__ == "__main__":
+    # The company you want to target
+    target_company = "OpenAI" 
+
+    # Clean up old debug screenshots (keep only the 5 most recent) while the searches run
+    threading.Thread(target=cleanup_debug_screenshots, args=(5,), daemon=True).start()
+
+    # --- Step 1: Google Search with OCR Extraction ---
+    # Navigate to Google search with targeted social media and email queries
+    # Focus ONLY on social profiles and contact information
+    print(f"--- Phase 1: Google Search with OCR Data Extraction ({LEAD_SEARCH_WORKERS} parallel browsers) ---")
+    all_leads_data = search_leads_parallel(target_company)
+    
+    # --- Step 2: Display Final Results ---
+    print("\n--- Final Results Summary ---")
+    if all_leads_data:
+        print("✅ Data extraction completed successfully!")
+        print(f"📊 Total searches executed: {len(all_leads_data)}")
+        # Gather unique links, text length and per-search counts in one pass
+        all_urls = set()
+        total_text = 0
+        per_search = []
+        for data in all_leads_data:
+            links = data.get('extracted_links', ())
+            all_urls.update(link['url'] for link in links)
+            total_text += data.get('total_text_length', 0)
+            per_search.append((data.get('extracted_data', {}).get('total_results', 0), len(links)))
+        print(f"🔗 Total unique links found: {len(all_urls)}")
+        print(f"📝 Total text extracted: {total_text} characters")
         
-        google_page.close()
+        # Display summary of all results
+        print("\n📋 Summary of All Extracted Data:")
+        for i, (total_results, link_count) in enumerate(per_search, 1):
+            print(f"  Search {i}: {total_results} results, {link_count} links")
         
-        # Clean up old debug screenshots (keep only the 5 most recent)
-        print("\n🧹 Cleaning up old debug screenshots...")
-        cleanup_debug_screenshots(keep_recent=5)
-
-        browser.close()
+        print("\n📄 Full JSON Results:")
+        json.dump(all_leads_data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print("❌ No data was extracted from any search queries.")
@@ -6,6 +6,7 @@
 class ContactFinderApp {
     constructor() {
         this.socket = null;
+        this.eventSource = null;
         this.currentSessionId = null;
         this.isProcessing = false;
         this.uploadedFile = null;
@@ -46,7 +47,7 @@ class ContactFinderApp {
     }
 
     /**
-     * Connect to WebSocket for real-time updates
+     * Connect to WebSocket for connection status; session progress arrives over Server-Sent Events
      */
     connectWebSocket() {
         try {
@@ -62,29 +63,59 @@ class ContactFinderApp {
                 this.showToast('Disconnected from server', 'warning');
             });
 
-            this.socket.on('progress_update', (data) => {
-                this.handleProgressUpdate(data);
-            });
+        } catch (error) {
+            console.error('❌ WebSocket connection failed:', error);
+            this.showToast('Failed to connect to server', 'error');
+        }
+    }
 
-            this.socket.on('result_update', (data) => {
-                this.handleResultUpdate(data);
-            });
+    /**
+     * Subscribe to a session's progress stream (Server-Sent Events)
+     */
+    subscribeToSession(sessionId) {
+        this.unsubscribeFromSession();
+
+        const handlers = {
+            progress_update: (data) => this.handleProgressUpdate(data),
+            result_update: (data) => this.handleResultUpdate(data),
+            log_message: (data) => this.handleLogMessage(data),
+            processing_complete: (data) => this.handleProcessingComplete(data),
+            processing_paused: (data) => this.handleProcessingPaused(data)
+        };
 
-            this.socket.on('log_message', (data) => {
-                this.handleLogMessage(data);
-            });
+        // On a dropped stream EventSource reconnects by itself and sends Last-Event-ID; the server replays what was missed
+        this.eventSource = new EventSource(`/progress/${sessionId}`);
 
-            this.socket.on('processing_complete', (data) => {
-                this.handleProcessingComplete(data);
-            });
+        Object.entries(handlers).forEach(([event, handler]) => {
+            this.eventSource.addEventListener(event, (e) => handler(JSON.parse(e.data)));
+        });
 
-            this.socket.on('processing_paused', (data) => {
-                this.handleProcessingPaused(data);
+        // Log messages arrive in batches from the server's log flusher
+        this.eventSource.addEventListener('log_batch', (e) => {
+            JSON.parse(e.data).messages.forEach((message) => this.handleLogMessage(message));
+        });
+
+        // The server closes the stream once a run completes or pauses; don't reconnect until the next start
+        this.eventSource.addEventListener('end', () => this.unsubscribeFromSession());
+
+        // Several events coalesced into one message by the server
+        this.eventSource.addEventListener('batch', (e) => {
+            JSON.parse(e.data).events.forEach(({ event, data }) => {
+                const handler = handlers[event];
+                if (handler) {
+                    handler(data);
+                }
             });
+        });
+    }
 
-        } catch (error) {
-            console.error('❌ WebSocket connection failed:', error);
-            this.showToast('Failed to connect to server', 'error');
+    /**
+     * Close the current progress stream, if any
+     */
+    unsubscribeFromSession() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
         }
     }
 
@@ -233,6 +264,9 @@ class ContactFinderApp {
         try {
             this.showLoadingOverlay(true, 'Starting processing...');
 
+            // Open the progress stream first so no early event is missed
+            this.subscribeToSession(this.currentSessionId);
+
             const response = await fetch(`/start_processing/${this.currentSessionId}`, {
                 method: 'POST'
             });
@@ -254,6 +288,7 @@ class ContactFinderApp {
 
         } catch (error) {
             console.error('❌ Start processing error:', error);
+            this.unsubscribeFromSession();
             this.showToast(`Failed to start processing: ${error.message}`, 'error');
         } finally {
             this.showLoadingOverlay(false);
@@ -294,6 +329,9 @@ class ContactFinderApp {
         if (!this.currentSessionId) return;
 
         try {
+            // The stream closed when the session paused; reopen it before resuming
+            this.subscribeToSession(this.currentSessionId);
+
             const response = await fetch(`/start_processing/${this.currentSessionId}`, {
                 method: 'POST'
             });
@@ -311,6 +349,7 @@ class ContactFinderApp {
 
         } catch (error) {
             console.error('❌ Resume processing error:', error);
+            this.unsubscribeFromSession();
             this.showToast(`Failed to resume processing: ${error.message}`, 'error');
         }
     }
@@ -612,6 +651,7 @@ class ContactFinderApp {
     removeFile() {
         this.uploadedFile = null;
         this.currentSessionId = null;
+        this.unsubscribeFromSession();
         
         // Reset file input
         document.getElementById('fileInput').value = '';
@@ -16,28 +16,75 @@ Author: Contact Finder Team
 """
 
 import os
+import re
 import csv
+import bisect
+import codecs
 import json
 import time
 import uuid
 import signal
 import threading
 import queue
+import atexit
+import logging
 import traceback
+from logging.handlers import QueueHandler, QueueListener
+from collections import deque
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from functools import lru_cache
+from flask import Flask, Response, render_template, request, jsonify, send_file, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit
 from werkzeug.utils import secure_filename
-import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from dotenv import load_dotenv
 
+# orjson (optional) serializes progress files and socket payloads much faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Import our existing contact finder functionality
 from company_contact_finder import CompanyContactFinder
 
 # Load environment variables
 load_dotenv()
 
+# Log records are queued by the calling thread and written to stderr by one listener thread,
+# so request handlers and workers never block on console output
+logger = logging.getLogger('contact_finder')
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+_log_handler = None
+_log_listener = None
+
+def _start_log_listener():
+    """Attach a fresh record queue and start its listener thread in the current process"""
+    global _log_handler, _log_listener
+    # A forked child inherits the handler but not the listener thread, so both are replaced
+    if _log_handler is not None:
+        logger.removeHandler(_log_handler)
+    records = queue.Queue()
+    _log_handler = QueueHandler(records)
+    logger.addHandler(_log_handler)
+    _log_listener = QueueListener(records, logging.StreamHandler())
+    _log_listener.start()
+
+def _stop_log_listener():
+    """Flush queued records and stop this process's listener"""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+_start_log_listener()
+# gunicorn's preload_app imports this module in the master and forks workers from it
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_start_log_listener)
+atexit.register(_stop_log_listener)
+
 # Configuration
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'contact-finder-secret-key-2024')
@@ -46,13 +93,174 @@ app.config['PROGRESS_FOLDER'] = 'progress_files'
 app.config['RESULTS_FOLDER'] = 'results'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
-# Initialize SocketIO for real-time updates
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+# Create the working folders once at import, so they exist however the app is served;
+# one directory listing tells which ones a previous run already made
+_existing_dirs = {entry.name for entry in os.scandir('.') if entry.is_dir()}
+for key in ('UPLOAD_FOLDER', 'PROGRESS_FOLDER', 'RESULTS_FOLDER'):
+    if app.config[key] not in _existing_dirs:
+        os.makedirs(app.config[key], exist_ok=True)
+
+def _json_dumps(data, indent=False):
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+# (second, 'HH:MM:SS') of the last formatted log timestamp; replaced as one tuple so threads never see a torn pair
+_ts_cache = (0, '')
+
+def _hms():
+    """Current wall-clock time as HH:MM:SS, formatted at most once per second"""
+    global _ts_cache
+    now = int(time.time())
+    cached = _ts_cache
+    if cached[0] != now:
+        cached = (now, time.strftime('%H:%M:%S', time.localtime(now)))
+        _ts_cache = cached
+    return cached[1]
+
+@lru_cache(maxsize=1024)
+def _format_timestamp(ts):
+    """Result timestamp as 'YYYY-MM-DD HH:MM:SS' local time; results keep their timestamp, so repeats are cache hits"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
+
+class _SocketJSON:
+    """json-module shim handed to SocketIO; formatting arguments such as separators are ignored"""
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return _json_dumps(obj).decode('utf-8')
+    
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return _json_loads(s)
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson; types orjson can't handle go through Flask's default"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response without a str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
+
+if ORJSON_AVAILABLE:
+    app.json = _OrjsonProvider(app)
+
+# Initialize SocketIO for real-time updates.
+# Stays on 'threading': eventlet/gevent would monkey-patch the sockets and threads that
+# Playwright's sync API and Selenium block on inside each company's browser session.
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', json=_SocketJSON if ORJSON_AVAILABLE else json)
+
+# Seconds the log flusher waits for messages before checking whether processing has finished
+LOG_FLUSH_INTERVAL = 0.1
+
+# Companies processed at the same time, each in its own browser
+COMPANY_WORKERS = min(8, int(os.environ.get('CF_WORKERS', '4')))
+# Minimum seconds between two companies of one session starting, shared by its workers
+COMPANY_START_INTERVAL = 2.0
+
+# Full progress snapshots are written every this many companies; changes in between are appended to a log
+PROGRESS_SNAPSHOT_EVERY = 25
+
+# Snapshots are fsynced to disk every this many saves; the rest rely on the OS flushing the page cache
+PROGRESS_FSYNC_EVERY = 25
+
+# Seconds of silence after which a progress stream sends a keep-alive comment
+SSE_HEARTBEAT_INTERVAL = 15
+# Longest a progress stream stays open before the client is made to reconnect
+SSE_MAX_STREAM_SECONDS = 300
+# Seconds a stream keeps forwarding after a run completes or pauses, before it closes
+SSE_CLOSE_GRACE = 2.0
+# Reconnect delay suggested to EventSource, in milliseconds
+SSE_RETRY_MS = 2000
+# Recent events kept per session, replayed to a stream that reconnects with Last-Event-ID
+SSE_REPLAY_BUFFER = 1000
+
+# Seconds shutdown waits for worker threads to finish their current company and close their browsers
+SHUTDOWN_WORKER_TIMEOUT = 10
 
 # Global variables for managing processing sessions
+# Reads are plain dict lookups (atomic under the GIL); session_lock only guards inserts and iteration.
+# A session's counters, results and errors are mutated only by its coordinator thread (in list order);
+# pool threads set current_company as each company starts. Both update the saved progress under the
+# session's _progress_lock, which also orders them against saves from pause requests.
 processing_sessions = {}
 session_lock = threading.Lock()
 
+# CEO profile platform keys and the URL slot each one fills; checked in order, so 'linkedin' wins over 'x'
+PLATFORM_SLOTS = {
+    'linkedin': 'linkedin',
+    'twitter': 'twitter',
+    'x': 'twitter',
+    'instagram': 'instagram',
+    'tiktok': 'tiktok'
+}
+
+def _platform_slot(platform):
+    """URL slot for a ceo_profiles key: exact key first, then the first slot keyword it contains"""
+    slot = PLATFORM_SLOTS.get(platform)
+    if slot is None:
+        slot = next((slot for keyword, slot in PLATFORM_SLOTS.items() if keyword in platform), None)
+    return slot
+
+def _extract_ceo_urls(ceo_profiles):
+    """First CEO profile URL found per platform slot, '' where none was found"""
+    urls = {'linkedin': '', 'twitter': '', 'instagram': '', 'tiktok': ''}
+    for platform, profile_data in ceo_profiles.items():
+        if isinstance(profile_data, dict) and profile_data.get('url'):
+            slot = _platform_slot(platform)
+            if slot and not urls[slot]:
+                urls[slot] = profile_data['url']
+    return urls
+
+def _norm_domain(domain):
+    """Domain without scheme or leading www., lowercased, for lookups"""
+    return domain.removeprefix('https://').removeprefix('http://').removeprefix('www.').lower()
+
+def _domain_suffixes(domain):
+    """Parent domains of a normalized domain, nearest first: a.b.com -> b.com, com"""
+    parts = domain.split('.')
+    return ['.'.join(parts[k:]) for k in range(1, len(parts))]
+
+def _extract_result_view(result):
+    """Walk one result once and return the flat fields shared by the CSV row and the result_update payload"""
+    company_data = result.get('company_website_data') or {}
+    ceo_data = result.get('ceo_data') or {}
+    ceo_profiles = ceo_data.get('ceo_profiles') or {}
+    
+    # Extract CEO profiles with proper handling for Twitter/X, falling back to direct keys
+    ceo_urls = _extract_ceo_urls(ceo_profiles)
+    return {
+        'linkedin_url': ceo_urls['linkedin'] or ceo_data.get('linkedin', ''),
+        'twitter_url': ceo_urls['twitter'] or ceo_data.get('twitter', '') or ceo_data.get('x', ''),
+        'instagram_url': ceo_urls['instagram'] or ceo_data.get('instagram', ''),
+        'tiktok_url': ceo_urls['tiktok'] or ceo_data.get('tiktok', ''),
+        'ceo_profiles_count': sum(1 for p in ceo_profiles.values() if isinstance(p, dict) and p.get('url')),
+        'emails': company_data.get('emails', []),
+        'phones': company_data.get('phones', []),
+        'social_links': company_data.get('socialLinks') or {},
+        'ceo_email': ceo_data.get('ceo_email', ''),
+        'email_confidence': ceo_data.get('email_confidence', 0),
+        'search_method': ceo_data.get('search_method'),
+        'search_confidence': ceo_data.get('search_confidence'),
+        'company_domain': result.get('company_domain', ''),
+        'company_name': result.get('company_name', ''),
+        'success': result.get('success'),
+        'timestamp': result.get('timestamp', time.time()),
+    }
+
 class ProcessingSession:
     def __init__(self, session_id, company_list, user_file_name):
         self.session_id = session_id
@@ -64,46 +272,211 @@ class ProcessingSession:
         self.is_running = False
         self.is_paused = False
         self.results = []
+        # Results by normalized domain and by lowercased name, for the company details lookup
+        self.results_by_domain = {}
+        self.results_by_name = {}
+        # (reversed normalized domain, insertion number, result) kept sorted by domain (moc.elpmaxe.pohs),
+        # so every subdomain of a query is one bisect away; smaller than indexing each parent domain.
+        # One list, so a reader never sees a key without its result
+        self._domain_index = []
+        # Serialized company details responses, by id() of the result
+        self._details_json = {}
+        # Bumped on every new result; part of the company lookup cache key
+        self.version = 0
         self.errors = []
         self.start_time = time.time()
         self.progress_file_path = os.path.join(app.config['PROGRESS_FOLDER'], f'progress_{session_id}.json')
+        # Per-company changes since the last full snapshot, one JSON object per line
+        self.progress_log_path = os.path.join(app.config['PROGRESS_FOLDER'], f'progress_{session_id}.jsonl')
         self.results_file_path = os.path.join(app.config['RESULTS_FOLDER'], f'results_{session_id}.csv')
+        # Log messages waiting for the flusher thread to send them to the client
+        self.log_queue = queue.Queue()
+        # One event queue per open /progress stream for this session
+        self._subscribers = []
+        self._subscribers_lock = threading.Lock()
+        # Recent (event id, event, data) triples, so a reconnecting stream can catch up
+        self._event_log = deque(maxlen=SSE_REPLAY_BUFFER)
+        self._last_event_id = 0
+        # Results CSV kept open while processing so each result is appended as one row
+        self._csv_fh = None
+        self._csv_writer = None
+        # Number of results already written to the results CSV
+        self._last_exported_idx = 0
+        # Validators for the results download, set whenever rows are written
+        self.results_mtime = None
+        self.results_etag = None
+        # Snapshots written so far, for pacing fsync
+        self._save_count = 0
+        # Serializes snapshot writes and change-log appends; re-entrant because record_progress saves
+        self._progress_lock = threading.RLock()
+        # Worker threads of the current run, joined on shutdown so they can close their browsers
+        self._workers = []
         # Don't create contact_finder here - create fresh instances per company to avoid threading issues
         
+    def subscribe(self, last_event_id=None):
+        """Register a new progress stream and return the queue its events arrive on.
+        A stream resuming after last_event_id first gets the buffered events it missed."""
+        subscriber = queue.Queue()
+        with self._subscribers_lock:
+            if last_event_id is not None:
+                if self._event_log and self._event_log[0][0] > last_event_id + 1:
+                    # Older events have left the buffer; the results CSV still has every row
+                    subscriber.put((None, 'log_message', {
+                        'session_id': self.session_id,
+                        'message': '⚠️ Some live updates were missed while reconnecting; download the results for the full list',
+                        'timestamp': _hms(),
+                        'type': 'warning'
+                    }))
+                for item in self._event_log:
+                    if item[0] > last_event_id:
+                        subscriber.put(item)
+            self._subscribers.append(subscriber)
+        return subscriber
+    
+    def unsubscribe(self, subscriber):
+        """Forget a progress stream once its client has gone"""
+        with self._subscribers_lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+    
+    def publish(self, event, data):
+        """Number an event, buffer it for replay and send it to every open progress stream of this session"""
+        # Queues are unbounded, so putting under the lock never blocks and keeps ids in order per stream
+        with self._subscribers_lock:
+            self._last_event_id += 1
+            item = (self._last_event_id, event, data)
+            self._event_log.append(item)
+            for subscriber in self._subscribers:
+                subscriber.put(item)
+    
+    def log(self, message, msg_type='info'):
+        """Queue a log message for the client; the flusher thread sends it with any others pending"""
+        self.log_queue.put({
+            'session_id': self.session_id,
+            'message': message,
+            'timestamp': _hms(),
+            'type': msg_type
+        })
+    
+    def add_result(self, result):
+        """Append a result and index it by domain and name; the first result for a key wins"""
+        self.results.append(result)
+        domain = result.get('company_domain') or ''
+        if domain:
+            domain = _norm_domain(domain)
+            self.results_by_domain.setdefault(domain, result)
+            # The insertion number keeps equal domains in arrival order and stops tuple comparison at the dicts
+            bisect.insort(self._domain_index, (domain[::-1], len(self.results), result))
+        name = result.get('company_name') or ''
+        if name:
+            self.results_by_name.setdefault(name.lower(), result)
+        # Last, so a lookup cached under the new version always saw the fully indexed result
+        self.version += 1
+    
+    def find_subdomain_result(self, domain):
+        """A result whose domain is under the given normalized domain, or None"""
+        # Reversed subdomains of example.com all start with 'moc.elpmaxe.' and sort together
+        prefix = domain[::-1] + '.'
+        index = self._domain_index
+        i = bisect.bisect_left(index, (prefix,))
+        if i < len(index) and index[i][0].startswith(prefix):
+            return index[i][2]
+        return None
+    
     def save_progress(self):
         """Save current progress to file for persistence"""
-        progress_data = {
-            'session_id': self.session_id,
-            'user_file_name': self.user_file_name,
-            'total_companies': self.total_companies,
-            'processed_companies': self.processed_companies,
-            'current_company': self.current_company,
-            'is_running': self.is_running,
-            'is_paused': self.is_paused,
-            'start_time': self.start_time,
-            'company_list': self.company_list,
-            'results': self.results,
-            'errors': self.errors
-        }
+        # The lock keeps a pause request and a worker from writing the same temp file at once,
+        # and keeps change-log appends out of the gap between taking the snapshot and removing the log
+        with self._progress_lock:
+            progress_data = {
+                'session_id': self.session_id,
+                'user_file_name': self.user_file_name,
+                'total_companies': self.total_companies,
+                'processed_companies': self.processed_companies,
+                'current_company': self.current_company,
+                'is_running': self.is_running,
+                'is_paused': self.is_paused,
+                'start_time': self.start_time,
+                'company_list': self.company_list,
+                'results': self.results,
+                'errors': self.errors
+            }
+            
+            # Write to a temp file and swap it in, so a crash mid-write never leaves a torn snapshot
+            tmp_path = self.progress_file_path + '.tmp'
+            self._save_count += 1
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(progress_data, indent=True))
+                if self._save_count % PROGRESS_FSYNC_EVERY == 0:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.progress_file_path)
+            
+            # The snapshot now includes everything the change log recorded
+            if os.path.exists(self.progress_log_path):
+                os.remove(self.progress_log_path)
+    
+    def _append_delta(self, delta):
+        """Append one change to the progress log without rewriting the snapshot"""
+        with self._progress_lock, open(self.progress_log_path, 'ab') as f:
+            f.write(_json_dumps(delta) + b'\n')
+    
+    def record_progress(self, **delta):
+        """Record a change cheaply, compacting into a full snapshot every PROGRESS_SNAPSHOT_EVERY companies"""
+        with self._progress_lock:
+            self._append_delta(delta)
+            if 'processed' in delta and self.processed_companies % PROGRESS_SNAPSHOT_EVERY == 0:
+                self.save_progress()
+    
+    def _replay_progress_log(self):
+        """Apply changes logged after the last snapshot"""
+        if not os.path.exists(self.progress_log_path):
+            return
         
-        with open(self.progress_file_path, 'w') as f:
-            json.dump(progress_data, f, indent=2)
+        snapshot_processed = self.processed_companies
+        with open(self.progress_log_path, 'rb') as f:
+            for line in f:
+                try:
+                    delta = _json_loads(line)
+                except ValueError:
+                    # A torn last line from a crash mid-write
+                    break
+                
+                # Skip entries already folded into the snapshot
+                if delta.get('processed', snapshot_processed + 1) <= snapshot_processed:
+                    continue
+                if 'current' in delta:
+                    self.current_company = delta['current']
+                if 'processed' in delta:
+                    self.processed_companies = delta['processed']
+                if 'result' in delta:
+                    self.add_result(delta['result'])
+                if 'error' in delta:
+                    self.errors.append(delta['error'])
     
     def load_progress(self):
         """Load progress from file if exists"""
         if os.path.exists(self.progress_file_path):
             try:
-                with open(self.progress_file_path, 'r') as f:
-                    progress_data = json.load(f)
+                with open(self.progress_file_path, 'rb') as f:
+                    progress_data = _json_loads(f.read())
                 
                 self.processed_companies = progress_data.get('processed_companies', 0)
                 self.current_company = progress_data.get('current_company')
                 self.start_time = progress_data.get('start_time', time.time())
-                self.results = progress_data.get('results', [])
+                self.results = []
+                self.results_by_domain = {}
+                self.results_by_name = {}
+                self._domain_index = []
+                self._details_json = {}
+                for result in progress_data.get('results', []):
+                    self.add_result(result)
                 self.errors = progress_data.get('errors', [])
+                self._replay_progress_log()
                 return True
-            except Exception as e:
-                print(f"Error loading progress: {e}")
+            except (OSError, ValueError) as e:
+                # ValueError covers malformed JSON from both json and orjson
+                logger.error(f"Error loading progress: {e}")
         return False
     
     def get_progress_percentage(self):
@@ -116,116 +489,155 @@ class ProcessingSession:
         """Get list of remaining companies to process"""
         return self.company_list[self.processed_companies:]
     
-    def export_to_csv(self):
-        """Export current results to CSV file"""
-        if not self.results:
-            return False
-        
+    # Display names for the common social platforms; others fall back to str.title()
+    _PLATFORM_TITLES = {
+        'linkedin': 'LinkedIn',
+        'twitter': 'Twitter',
+        'instagram': 'Instagram',
+        'tiktok': 'TikTok',
+        'facebook': 'Facebook',
+        'youtube': 'YouTube',
+    }
+    
+    # Columns of the results CSV
+    CSV_HEADERS = [
+        'Company Domain',
+        'Company Name', 
+        'Website Emails',
+        'Website Phones',
+        'Website Social Links',
+        'CEO LinkedIn',
+        'CEO Twitter/X',
+        'CEO Instagram',
+        'CEO TikTok',
+        'CEO Email',
+        'Email Confidence',
+        'Search Method',
+        'Search Confidence',
+        'Processing Status',
+        'Timestamp'
+    ]
+    
+    def _result_to_csv_row(self, result, view=None):
+        """Build the CSV row for one result"""
+        if view is None:
+            view = _extract_result_view(result)
+        
+        return [
+            view['company_domain'],
+            view['company_name'],
+            '; '.join(view['emails']),
+            '; '.join(view['phones']),
+            self._format_social_links(view['social_links']),
+            view['linkedin_url'],
+            view['twitter_url'],
+            view['instagram_url'],
+            view['tiktok_url'],
+            view['ceo_email'],
+            f"{view['email_confidence']}%" if view['email_confidence'] > 0 else '',
+            view['search_method'] or 'Unknown',
+            view['search_confidence'] or 'Unknown',
+            'Success' if view['success'] else 'Failed',
+            _format_timestamp(view['timestamp'])
+        ]
+    
+    def append_result_to_csv(self, result, view=None):
+        """Write one new result to the open results CSV, opening it with all earlier results on first use"""
         try:
-            # Define CSV headers
-            headers = [
-                'Company Domain',
-                'Company Name', 
-                'Website Emails',
-                'Website Phones',
-                'Website Social Links',
-                'CEO LinkedIn',
-                'CEO Twitter/X',
-                'CEO Instagram',
-                'CEO TikTok',
-                'CEO Email',
-                'Email Confidence',
-                'Search Method',
-                'Search Confidence',
-                'Processing Status',
-                'Timestamp'
-            ]
-            
-            with open(self.results_file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(headers)
-                
-                for result in self.results:
-                    # Extract data from result
-                    company_data = result.get('company_website_data', {})
-                    ceo_data = result.get('ceo_data', {})
-                    
-                    # Extract CEO profiles with proper handling for Twitter/X
-                    ceo_profiles = ceo_data.get('ceo_profiles', {})
-                    linkedin_url = ''
-                    twitter_url = ''
-                    instagram_url = ''
-                    tiktok_url = ''
-                    
-                    # Extract URLs from ceo_profiles
-                    for platform, profile_data in ceo_profiles.items():
-                        if isinstance(profile_data, dict) and profile_data.get('url'):
-                            if 'linkedin' in platform:
-                                linkedin_url = profile_data['url']
-                            elif 'twitter' in platform or 'x' in platform:
-                                if not twitter_url:  # Only take the first Twitter/X URL found
-                                    twitter_url = profile_data['url']
-                            elif 'instagram' in platform:
-                                instagram_url = profile_data['url']
-                            elif 'tiktok' in platform:
-                                tiktok_url = profile_data['url']
-                    
-                    # Fallback to direct keys if profiles not found
-                    if not linkedin_url:
-                        linkedin_url = ceo_data.get('linkedin', '')
-                    if not twitter_url:
-                        twitter_url = ceo_data.get('twitter', '') or ceo_data.get('x', '')
-                    if not instagram_url:
-                        instagram_url = ceo_data.get('instagram', '')
-                    if not tiktok_url:
-                        tiktok_url = ceo_data.get('tiktok', '')
-                    
-                    row = [
-                        result.get('company_domain', ''),
-                        result.get('company_name', ''),
-                        '; '.join(company_data.get('emails', [])),
-                        '; '.join(company_data.get('phones', [])),
-                        self._format_social_links(company_data.get('socialLinks', {})),
-                        linkedin_url,
-                        twitter_url,
-                        instagram_url,
-                        tiktok_url,
-                        ceo_data.get('ceo_email', ''),
-                        f"{ceo_data.get('email_confidence', 0)}%" if ceo_data.get('email_confidence', 0) > 0 else '',
-                        ceo_data.get('search_method', 'Unknown'),
-                        ceo_data.get('search_confidence', 'Unknown'),
-                        'Success' if result.get('success') else 'Failed',
-                        datetime.fromtimestamp(result.get('timestamp', time.time())).strftime('%Y-%m-%d %H:%M:%S')
-                    ]
-                    writer.writerow(row)
-            
+            if self._csv_writer is None:
+                # Headers plus every result so far, including this one and any loaded from saved progress
+                self._csv_fh = open(self.results_file_path, 'w', newline='', encoding='utf-8')
+                self._csv_writer = csv.writer(self._csv_fh)
+                self._csv_writer.writerow(self.CSV_HEADERS)
+                self._csv_writer.writerows(self._result_to_csv_row(r) for r in self.results)
+            else:
+                self._csv_writer.writerow(self._result_to_csv_row(result, view))
+            # Keep the file complete on disk so it can be downloaded mid-run
+            self._csv_fh.flush()
+            self._mark_results_written()
             return True
         except Exception as e:
-            print(f"Error exporting to CSV: {e}")
+            logger.error(f"Error appending to CSV: {e}")
             return False
     
+    def _mark_results_written(self):
+        """Record how far the CSV goes and refresh its download validators"""
+        self._last_exported_idx = len(self.results)
+        # The CSV only ever grows by whole rows, so the row count identifies its content
+        self.results_mtime = time.time()
+        self.results_etag = f'{self.session_id}-{self._last_exported_idx}'
+    
+    def close_csv(self):
+        """Close the results CSV opened by append_result_to_csv"""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+    
     def _format_social_links(self, social_links):
         """Format social links dictionary into readable string"""
         if not social_links:
             return ''
         
-        formatted_links = []
-        for platform, url in social_links.items():
-            if url:
-                formatted_links.append(f"{platform.title()}: {url}")
-        
-        return '; '.join(formatted_links)
+        titles = self._PLATFORM_TITLES
+        return '; '.join(f"{titles.get(platform) or platform.title()}: {url}"
+                         for platform, url in social_links.items() if url)
 
 def allowed_file(filename):
     """Check if uploaded file has allowed extension"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'csv', 'xlsx', 'xls'}
 
-def parse_company_file(file_path, filename):
-    """Parse uploaded file to extract company domains/names"""
+# Encodings tried for CSV uploads, in order; Latin-1 decodes any byte, so it always succeeds last
+CSV_ENCODINGS = ['utf-8-sig', 'cp1252', 'iso-8859-1']
+
+def _detect_encoding(sample):
+    """Pick the first encoding that decodes a sample of the file (BOM-aware UTF-8, then Windows/Latin-1)"""
+    for encoding in CSV_ENCODINGS:
+        try:
+            logger.debug("🔤 Trying encoding: %s", encoding)
+            # Incremental decode so a multi-byte character cut off at the end of the sample isn't an error
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError as e:
+            logger.debug("❌ %s failed: %s", encoding, e)
+    
+    raise ValueError("Could not read CSV file with any supported encoding")
+
+def _extract_companies(rows, column_index):
+    """Collect the non-empty values of one column from an iterable of rows"""
     companies = []
+    for index, row in enumerate(rows):
+        try:
+            # Short rows (including blank lines) have no value in this column
+            if column_index >= len(row):
+                continue
+            company_value = str(row[column_index]).strip()
+            if company_value and company_value.lower() not in ['nan', 'none', '', 'null']:
+                companies.append(company_value)
+        except (KeyError, ValueError, AttributeError, TypeError) as e:
+            logger.warning(f"⚠️ Error processing row {index}: {e}")
+            continue
+    return companies
+
+# Header keywords that mark the company domain/name column
+_COL_KEYWORD_RE = re.compile(r'company|domain|website|url|site', re.IGNORECASE)
+
+def _pick_company_column(columns):
+    """Index and name of the column holding company domains/names"""
+    # Look for company domain/name columns
+    possible_columns = []
+    for index, col in enumerate(columns):
+        if _COL_KEYWORD_RE.search(str(col)):
+            possible_columns.append(index)
     
+    # If no obvious column found, use the first column
+    column_index = possible_columns[0] if possible_columns else 0
+    return column_index, columns[column_index]
+
+def parse_company_file(file_path, filename):
+    """Parse uploaded file to extract company domains/names"""
     try:
-        print(f"📄 Parsing file: {filename} at {file_path}")
+        logger.info(f"📄 Parsing file: {filename} at {file_path}")
         
         # Check if file exists
         if not os.path.exists(file_path):
@@ -233,79 +645,71 @@ def parse_company_file(file_path, filename):
         
         # Check file size
         file_size = os.path.getsize(file_path)
-        print(f"📊 File size: {file_size} bytes")
+        logger.info(f"📊 File size: {file_size} bytes")
         
         if file_size == 0:
             raise ValueError("File is empty")
         
         file_ext = filename.rsplit('.', 1)[1].lower()
-        print(f"📋 File extension: {file_ext}")
+        logger.info(f"📋 File extension: {file_ext}")
         
         if file_ext == 'csv':
-            # Try different encodings for CSV
-            encodings = ['utf-8', 'utf-8-sig', 'iso-8859-1', 'cp1252']
-            df = None
-            
-            for encoding in encodings:
+            # Stream the rows with the csv module; only the target column is kept.
+            # The sample picks where to start, but a bad byte past it restarts with the next encoding
+            with open(file_path, 'rb') as f:
+                first = CSV_ENCODINGS.index(_detect_encoding(f.read(64 * 1024)))
+            for encoding in CSV_ENCODINGS[first:]:
                 try:
-                    print(f"🔤 Trying encoding: {encoding}")
-                    df = pd.read_csv(file_path, encoding=encoding)
-                    print(f"✅ Successfully read CSV with {encoding} encoding")
+                    with open(file_path, 'r', encoding=encoding, newline='') as f:
+                        reader = csv.reader(f)
+                        columns = next(reader, None)
+                        if not columns:
+                            raise ValueError("CSV file has no header row")
+                        
+                        column_index, target_column = _pick_company_column(columns)
+                        
+                        # Extract companies from the first matching column
+                        companies = _extract_companies(reader, column_index)
                     break
                 except UnicodeDecodeError as e:
-                    print(f"❌ {encoding} failed: {e}")
-                    continue
-                except Exception as e:
-                    print(f"❌ {encoding} failed with error: {e}")
-                    continue
-            
-            if df is None:
+                    logger.debug("❌ %s failed: %s", encoding, e)
+            else:
                 raise ValueError("Could not read CSV file with any supported encoding")
-                
+            
+            logger.info(f"✅ Successfully read CSV with {encoding} encoding")
+            logger.info(f"📋 Columns: {columns}")
+            logger.info(f"🎯 Using column: '{target_column}'")
+            
         elif file_ext in ['xlsx', 'xls']:
-            print(f"📊 Reading Excel file...")
+            # pandas is only needed for Excel files, so it is imported here
+            import pandas as pd
+            
+            logger.info(f"📊 Reading Excel file...")
             df = pd.read_excel(file_path)
-            print(f"✅ Successfully read Excel file")
+            logger.info(f"✅ Successfully read Excel file")
+            
+            logger.info(f"📈 DataFrame shape: {df.shape}")
+            columns = list(df.columns)
+            logger.info(f"📋 Columns: {columns}")
+            
+            column_index, target_column = _pick_company_column(columns)
+            logger.info(f"🎯 Using column: '{target_column}'")
+            
+            # Extract companies from the first matching column
+            companies = _extract_companies(df.itertuples(index=False, name=None), column_index)
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
         
-        print(f"📈 DataFrame shape: {df.shape}")
-        print(f"📋 Columns: {list(df.columns)}")
-        
-        # Look for company domain/name columns
-        possible_columns = []
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(keyword in col_lower for keyword in ['company', 'domain', 'website', 'url', 'site']):
-                possible_columns.append(col)
-        
-        # If no obvious column found, use the first column
-        if not possible_columns:
-            possible_columns = [df.columns[0]]
-        
-        target_column = possible_columns[0]
-        print(f"🎯 Using column: '{target_column}'")
-        
-        # Extract companies from the first matching column
-        for index, row in df.iterrows():
-            try:
-                company_value = str(row[target_column]).strip()
-                if company_value and company_value.lower() not in ['nan', 'none', '', 'null']:
-                    companies.append(company_value)
-            except Exception as e:
-                print(f"⚠️ Error processing row {index}: {e}")
-                continue
-        
-        print(f"🏢 Found {len(companies)} companies")
+        logger.info(f"🏢 Found {len(companies)} companies")
         if companies:
-            print(f"📋 First 3 companies: {companies[:3]}")
+            logger.info(f"📋 First 3 companies: {companies[:3]}")
         
         return companies, target_column
         
     except Exception as e:
         error_msg = f"Error parsing file {filename}: {str(e)}"
-        print(f"❌ {error_msg}")
-        print(f"📍 Traceback: {traceback.format_exc()}")
+        logger.error(f"❌ {error_msg}")
+        logger.error(f"📍 Traceback: {traceback.format_exc()}")
         raise e
 
 @app.route('/')
@@ -327,9 +731,6 @@ def upload_file():
         if not allowed_file(file.filename):
             return jsonify({'error': 'Invalid file format. Please upload CSV, XLSX, or XLS files only.'}), 400
         
-        # Generate unique session ID
-        session_id = str(uuid.uuid4())
-        
         # Save uploaded file
         if not file.filename:
             return jsonify({'error': 'Invalid filename'}), 400
@@ -349,15 +750,21 @@ def upload_file():
         if not companies:
             return jsonify({'error': 'No companies found in the uploaded file'}), 400
         
-        # Create processing session
-        session = ProcessingSession(session_id, companies, filename)
+        # The same file name and company list always map to the same session, so re-uploading a file whose
+        # run was cut short by a restart or crash resumes from its saved snapshot plus change log
+        session_id = str(uuid.uuid5(uuid.NAMESPACE_URL, '\n'.join([filename, *companies])))
         
         with session_lock:
-            processing_sessions[session_id] = session
-        
-        # Try to load existing progress
-        session.load_progress()
-        session.save_progress()
+            session = processing_sessions.get(session_id)
+            if session is None or not session.is_running:
+                session = ProcessingSession(session_id, companies, filename)
+                if not session.load_progress() or session.processed_companies >= session.total_companies:
+                    # Nothing saved, or that run already finished: start over, without the old run's CSV
+                    session = ProcessingSession(session_id, companies, filename)
+                    if os.path.exists(session.results_file_path):
+                        os.remove(session.results_file_path)
+                processing_sessions[session_id] = session
+                session.save_progress()
         
         return jsonify({
             'success': True,
@@ -369,24 +776,45 @@ def upload_file():
         })
         
     except Exception as e:
-        print(f"Error in upload_file: {e}")
+        logger.error(f"Error in upload_file: {e}")
         return jsonify({'error': f'Error processing file: {str(e)}'}), 500
 
+# Companies one finder processes before its browser is recycled
+FINDER_MAX_USES = 20
+
+# Each worker thread keeps its own finder: Playwright's sync objects only work on the thread that made them
+_finder_tls = threading.local()
+
+def _get_finder():
+    """This thread's contact finder, replaced with a fresh one after FINDER_MAX_USES companies"""
+    finder = getattr(_finder_tls, 'finder', None)
+    if finder is None or finder.uses >= FINDER_MAX_USES:
+        if finder is not None:
+            finder.cleanup_browser()
+        finder = CompanyContactFinder(skip_ceo_on_captcha=False)
+        finder.uses = 0
+        _finder_tls.finder = finder
+    return finder
+
+def _drop_finder():
+    """Close this thread's contact finder and its browser, if it has one"""
+    finder = getattr(_finder_tls, 'finder', None)
+    if finder is not None:
+        _finder_tls.finder = None
+        finder.cleanup_browser()
+
 def process_single_company_isolated(company, session_id):
     """Process a single company in complete thread isolation from Flask-SocketIO"""
     try:
-        # Create a completely fresh contact finder instance in this thread
-        # This ensures no shared state with Flask-SocketIO's asyncio loop
-        contact_finder = CompanyContactFinder(skip_ceo_on_captcha=False)
+        # Reuse this worker thread's finder so its browser stays up between companies
+        contact_finder = _get_finder()
         
-        print(f"\n🎯 Processing: {company}")
-        print("=" * 60)
+        logger.info(f"\n🎯 Processing: {company}")
+        logger.info("=" * 60)
         
-        # Process the company (this will create its own browser instance)
+        # Process the company (the finder starts its browser on first use)
         result = contact_finder.find_company_contacts(company)
-        
-        # Clean up the browser after processing this company
-        contact_finder.cleanup_browser()
+        contact_finder.uses += 1
         
         return {
             'success': True,
@@ -396,9 +824,12 @@ def process_single_company_isolated(company, session_id):
         }
         
     except Exception as e:
-        print(f"❌ Error processing {company}: {e}")
+        logger.error(f"❌ Error processing {company}: {e}")
         import traceback
-        print(f"📍 Traceback: {traceback.format_exc()}")
+        logger.error(f"📍 Traceback: {traceback.format_exc()}")
+        
+        # Start the next company with a fresh browser
+        _drop_finder()
         
         return {
             'success': False,
@@ -407,14 +838,120 @@ def process_single_company_isolated(company, session_id):
             'error': str(e)
         }
 
+def _emit_batch(session, events):
+    """Send several (event, payload) pairs to the client as a single 'batch' event"""
+    session.publish('batch', {
+        'session_id': session.session_id,
+        'events': [{'event': event, 'data': data} for event, data in events]
+    })
+
+def _drain(log_queue, timeout):
+    """Wait up to timeout for one message, then take every other message already queued"""
+    try:
+        messages = [log_queue.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    while True:
+        try:
+            messages.append(log_queue.get_nowait())
+        except queue.Empty:
+            return messages
+
+def _log_flusher(session, worker):
+    """Send a session's queued log messages as 'log_batch' frames until its worker thread finishes"""
+    while worker.is_alive() or not session.log_queue.empty():
+        messages = _drain(session.log_queue, LOG_FLUSH_INTERVAL)
+        if messages:
+            session.publish('log_batch', {'session_id': session.session_id, 'messages': messages})
+
+class RateLimiter:
+    """Spaces out events shared by several threads to at most one per interval"""
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the caller may go ahead, reserving the next slot"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+def _process_company_paced(session, company, rate_limiter):
+    """Pool task: wait for a start slot, announce the company and process it (None if paused meanwhile)"""
+    if session.is_paused:
+        return None
+    rate_limiter.wait()
+    if session.is_paused:
+        return None
+    
+    # Shared with the coordinator and pause requests, so set and logged together under the progress lock
+    with session._progress_lock:
+        session.current_company = company
+        session.record_progress(current=company)
+    
+    # Emit progress update
+    session.publish('progress_update', {
+        'session_id': session.session_id,
+        'current_company': company,
+        'processed': session.processed_companies,
+        'total': session.total_companies,
+        'percentage': session.get_progress_percentage()
+    })
+    
+    # Queue log message
+    session.log(f"🔄 Processing: {company}")
+    
+    return process_single_company_isolated(company, session.session_id)
+
+def _company_worker(session, tasks, rate_limiter):
+    """Pool thread: run queued (future, company) tasks until none are left or the session pauses,
+    then close this thread's browser, which only this thread can do"""
+    try:
+        while True:
+            try:
+                future, company = tasks.get_nowait()
+            except queue.Empty:
+                break
+            # Skips tasks the coordinator already cancelled on pause
+            if not future.set_running_or_notify_cancel():
+                continue
+            if session.is_paused:
+                # Settled as "paused before it started" so the coordinator never waits on it
+                future.set_result(None)
+                continue
+            try:
+                future.set_result(_process_company_paced(session, company, rate_limiter))
+            except Exception as e:
+                future.set_exception(e)
+    finally:
+        _drop_finder()
+
+def _pause_session(session, futures):
+    """Stop handing out companies and save the session so it can be resumed later"""
+    # Companies not started yet are dropped; ones in flight finish in the background
+    for pending in futures:
+        pending.cancel()
+    session.is_running = False
+    session.save_progress()
+    # Resuming reopens the CSV and rewrites it from the saved results
+    session.close_csv()
+    session.publish('processing_paused', {
+        'session_id': session.session_id,
+        'message': 'Processing paused by user'
+    })
+
 def process_companies_background(session_id):
     """Background function to process companies with real-time updates"""
+    session = None
     try:
-        with session_lock:
-            session = processing_sessions.get(session_id)
+        session = processing_sessions.get(session_id)
         
         if not session:
-            print(f"Session {session_id} not found")
+            logger.info(f"Session {session_id} not found")
             return
         
         session.is_running = True
@@ -423,113 +960,76 @@ def process_companies_background(session_id):
         
         # Get remaining companies to process
         remaining_companies = session.get_remaining_companies()
-        
-        for i, company in enumerate(remaining_companies):
+        workers = max(1, min(COMPANY_WORKERS, len(remaining_companies)))
+        
+        # Worker threads pull companies from a queue; each closes its own browser when it runs out or the session pauses
+        tasks = queue.Queue()
+        futures = []
+        for company in remaining_companies:
+            future = Future()
+            futures.append(future)
+            tasks.put((future, company))
+        # Companies of this run start at most once per COMPANY_START_INTERVAL, without holding up other sessions
+        rate_limiter = RateLimiter(COMPANY_START_INTERVAL)
+        session._workers = [
+            threading.Thread(target=_company_worker, args=(session, tasks, rate_limiter),
+                             name=f'company-worker-{session_id[:8]}-{i}', daemon=True)
+            for i in range(workers)
+        ]
+        for worker in session._workers:
+            worker.start()
+        
+        # Results are handled in list order, so processed_companies always counts a prefix
+        # of company_list and a resumed session picks up exactly where this one stopped
+        for future, company in zip(futures, remaining_companies):
             # Check if processing should be paused
             if session.is_paused:
-                session.is_running = False
-                session.save_progress()
-                socketio.emit('processing_paused', {
-                    'session_id': session_id,
-                    'message': 'Processing paused by user'
-                })
+                _pause_session(session, futures)
                 break
             
+            # Set once the company is counted, so a failure after that can't count it twice
+            counted = False
             try:
-                session.current_company = company
-                session.save_progress()
-                
-                # Emit progress update
-                socketio.emit('progress_update', {
-                    'session_id': session_id,
-                    'current_company': company,
-                    'processed': session.processed_companies,
-                    'total': session.total_companies,
-                    'percentage': session.get_progress_percentage()
-                })
-                
-                # Emit log message
-                socketio.emit('log_message', {
-                    'session_id': session_id,
-                    'message': f"🔄 Processing: {company}",
-                    'timestamp': datetime.now().strftime('%H:%M:%S'),
-                    'type': 'info'
-                })
-                
-                # Process the company using thread isolation to avoid asyncio conflicts
-                result_queue = queue.Queue()
-                
-                def isolated_worker():
-                    """Worker function that runs in complete isolation"""
-                    result = process_single_company_isolated(company, session_id)
-                    result_queue.put(result)
-                
-                # Create and start isolated thread
-                worker_thread = threading.Thread(target=isolated_worker)
-                worker_thread.start()
-                
-                # Wait for result (this is safe in background thread)
-                worker_thread.join()
-                processing_result = result_queue.get()
+                processing_result = future.result()
+                if processing_result is None:
+                    # Paused before this company started
+                    _pause_session(session, futures)
+                    break
                 
                 if processing_result['success']:
                     result = processing_result['result']
-                    session.results.append(result)
+                    session.add_result(result)
+                    delta = {'result': result}
                     
-                    # Emit detailed result for table display
-                    ceo_profiles = result.get('ceo_data', {}).get('ceo_profiles', {})
-                    ceo_count = len([p for p in ceo_profiles.values() if p.get('url')])
+                    # One pass over the result feeds both the CSV row and the table display
+                    view = _extract_result_view(result)
                     
-                    # Extract CEO profile URLs for display
-                    linkedin_url = ""
-                    twitter_url = ""
-                    instagram_url = ""
-                    tiktok_url = ""
+                    # Add the new result to the results CSV
+                    session.append_result_to_csv(result, view)
                     
-                    for platform, profile_data in ceo_profiles.items():
-                        if profile_data.get('url'):
-                            if 'linkedin' in platform:
-                                linkedin_url = profile_data['url']
-                            elif 'twitter' in platform or 'x' in platform:
-                                twitter_url = profile_data['url']
-                            elif 'instagram' in platform:
-                                instagram_url = profile_data['url']
-                            elif 'tiktok' in platform:
-                                tiktok_url = profile_data['url']
-                    
-                    # Extract website data for display
-                    website_data = result.get('company_website_data', {})
-                    emails = website_data.get('emails', [])
-                    phones = website_data.get('phones', [])
-                    social_links = website_data.get('social_links', {})
-                    
-                    socketio.emit('result_update', {
+                    # Emit detailed result for table display
+                    session.publish('result_update', {
                         'session_id': session_id,
                         'company': company,
                         'result': result,
                         'status': 'success',
                         'detailed_info': {
-                            'ceo_profiles_count': ceo_count,
-                            'linkedin_url': linkedin_url,
-                            'twitter_url': twitter_url,
-                            'instagram_url': instagram_url,
-                            'tiktok_url': tiktok_url,
-                            'ceo_email': result.get('ceo_data', {}).get('ceo_email', ''),
-                            'email_confidence': result.get('ceo_data', {}).get('email_confidence', 0),
-                            'emails_found': emails,
-                            'phones_found': phones,
-                            'social_links_found': list(social_links.keys()) if social_links else [],
-                            'search_method': result.get('ceo_data', {}).get('search_method', 'unknown'),
-                            'search_confidence': result.get('ceo_data', {}).get('search_confidence', 'unknown')
+                            'ceo_profiles_count': view['ceo_profiles_count'],
+                            'linkedin_url': view['linkedin_url'],
+                            'twitter_url': view['twitter_url'],
+                            'instagram_url': view['instagram_url'],
+                            'tiktok_url': view['tiktok_url'],
+                            'ceo_email': view['ceo_email'],
+                            'email_confidence': view['email_confidence'],
+                            'emails_found': view['emails'],
+                            'phones_found': view['phones'],
+                            'social_links_found': list(view['social_links']),
+                            'search_method': view['search_method'] or 'unknown',
+                            'search_confidence': view['search_confidence'] or 'unknown'
                         }
                     })
                     
-                    socketio.emit('log_message', {
-                        'session_id': session_id,
-                        'message': f"✅ Completed: {company}",
-                        'timestamp': datetime.now().strftime('%H:%M:%S'),
-                        'type': 'success'
-                    })
+                    session.log(f"✅ Completed: {company}", 'success')
                 else:
                     # Handle error case
                     error_msg = processing_result['error']
@@ -538,33 +1038,27 @@ def process_companies_background(session_id):
                         'errors': [error_msg],
                         'timestamp': time.time()
                     })
+                    delta = {'error': session.errors[-1]}
                     
-                    socketio.emit('result_update', {
+                    session.publish('result_update', {
                         'session_id': session_id,
                         'company': company,
                         'result': {'error': error_msg},
                         'status': 'error'
                     })
                     
-                    socketio.emit('log_message', {
-                        'session_id': session_id,
-                        'message': f"❌ Failed: {company} - {error_msg}",
-                        'timestamp': datetime.now().strftime('%H:%M:%S'),
-                        'type': 'error'
-                    })
+                    session.log(f"❌ Failed: {company} - {error_msg}", 'error')
                 
                 session.processed_companies += 1
-                session.save_progress()
-                
-                # Export results to CSV after each successful processing
-                session.export_to_csv()
-                
-                # Add delay between requests to avoid rate limiting
-                time.sleep(2)
+                counted = True
+                session.record_progress(processed=session.processed_companies, current=company, **delta)
                 
             except Exception as e:
                 error_msg = f"Exception processing {company}: {str(e)}"
-                print(error_msg)
+                logger.error(error_msg)
+                if counted:
+                    # The company's outcome is already recorded; only the progress bookkeeping failed
+                    continue
                 
                 session.errors.append({
                     'company': company,
@@ -572,15 +1066,10 @@ def process_companies_background(session_id):
                     'timestamp': time.time()
                 })
                 
-                socketio.emit('log_message', {
-                    'session_id': session_id,
-                    'message': f"❌ Error: {company} - {error_msg}",
-                    'timestamp': datetime.now().strftime('%H:%M:%S'),
-                    'type': 'error'
-                })
+                session.log(f"❌ Error: {company} - {error_msg}", 'error')
                 
                 session.processed_companies += 1
-                session.save_progress()
+                session.record_progress(processed=session.processed_companies, current=company, error=session.errors[-1])
         
         # Processing completed
         if not session.is_paused:
@@ -589,53 +1078,44 @@ def process_companies_background(session_id):
             
             # Clean up any remaining resources since processing is complete
             # (Each company already cleaned up its own browser instance)
-            print(f"Session {session_id} processing completed")
+            logger.info(f"Session {session_id} processing completed")
             
             session.save_progress()
             
-            # Final CSV export
-            session.export_to_csv()
-            
-            # Send final progress update to ensure 100% completion
-            socketio.emit('progress_update', {
-                'session_id': session_id,
-                'current_company': 'Processing Complete!',
-                'processed': session.total_companies,
-                'total': session.total_companies,
-                'percentage': 100
-            })
+            # Every result is already in the CSV; just close it
+            session.close_csv()
             
-            socketio.emit('processing_complete', {
-                'session_id': session_id,
-                'total_processed': session.processed_companies,
-                'total_companies': session.total_companies,
-                'success_count': len(session.results),
-                'error_count': len(session.errors),
-                'csv_available': os.path.exists(session.results_file_path)
-            })
+            # Send final progress update to ensure 100% completion, together with the summary
+            _emit_batch(session, [
+                ('progress_update', {
+                    'session_id': session_id,
+                    'current_company': 'Processing Complete!',
+                    'processed': session.total_companies,
+                    'total': session.total_companies,
+                    'percentage': 100
+                }),
+                ('processing_complete', {
+                    'session_id': session_id,
+                    'total_processed': session.processed_companies,
+                    'total_companies': session.total_companies,
+                    'success_count': len(session.results),
+                    'error_count': len(session.errors),
+                    'csv_available': os.path.exists(session.results_file_path)
+                })
+            ])
             
-            socketio.emit('log_message', {
-                'session_id': session_id,
-                'message': f"🎉 Processing completed! {len(session.results)} successful, {len(session.errors)} errors",
-                'timestamp': datetime.now().strftime('%H:%M:%S'),
-                'type': 'success'
-            })
+            session.log(f"🎉 Processing completed! {len(session.results)} successful, {len(session.errors)} errors", 'success')
     
     except Exception as e:
-        print(f"Error in background processing: {e}")
-        socketio.emit('log_message', {
-            'session_id': session_id,
-            'message': f"💥 Critical error in processing: {str(e)}",
-            'timestamp': datetime.now().strftime('%H:%M:%S'),
-            'type': 'error'
-        })
+        logger.error(f"Error in background processing: {e}")
+        if session:
+            session.log(f"💥 Critical error in processing: {str(e)}", 'error')
 
 @app.route('/start_processing/<session_id>', methods=['POST'])
 def start_processing(session_id):
     """Start or resume processing for a session"""
     try:
-        with session_lock:
-            session = processing_sessions.get(session_id)
+        session = processing_sessions.get(session_id)
         
         if not session:
             return jsonify({'error': 'Session not found'}), 404
@@ -643,18 +1123,14 @@ def start_processing(session_id):
         if session.is_running:
             return jsonify({'error': 'Processing is already running'}), 400
         
-        # Start background processing
-        thread = threading.Thread(target=process_companies_background, args=(session_id,))
-        thread.daemon = True
-        thread.start()
+        # Start background processing with whatever task primitive the SocketIO async mode uses
+        thread = socketio.start_background_task(process_companies_background, session_id)
         
-        # Emit initial log message about captcha handling
-        socketio.emit('log_message', {
-            'session_id': session_id,
-            'message': '🔍 Browser runs headless by default - will show only if captcha is detected',
-            'timestamp': datetime.now().strftime('%H:%M:%S'),
-            'type': 'info'
-        })
+        # Forward the session's log messages to the client while it runs
+        socketio.start_background_task(_log_flusher, session, thread)
+        
+        # Initial log message about captcha handling
+        session.log('🔍 Browser runs headless by default - will show only if captcha is detected')
         
         return jsonify({'success': True, 'message': 'Processing started'})
         
@@ -665,8 +1141,7 @@ def start_processing(session_id):
 def pause_processing(session_id):
     """Pause processing for a session"""
     try:
-        with session_lock:
-            session = processing_sessions.get(session_id)
+        session = processing_sessions.get(session_id)
         
         if not session:
             return jsonify({'error': 'Session not found'}), 404
@@ -686,8 +1161,7 @@ def pause_processing(session_id):
 def stop_processing(session_id):
     """Stop and cleanup processing for a session"""
     try:
-        with session_lock:
-            session = processing_sessions.get(session_id)
+        session = processing_sessions.get(session_id)
         
         if not session:
             return jsonify({'error': 'Session not found'}), 404
@@ -696,7 +1170,7 @@ def stop_processing(session_id):
         session.is_running = False
         
         # Note: Each company creates its own browser instance and cleans up automatically
-        print(f"Processing stopped for session {session_id}")
+        logger.info(f"Processing stopped for session {session_id}")
         
         session.save_progress()
         
@@ -709,8 +1183,7 @@ def stop_processing(session_id):
 def session_status(session_id):
     """Get current status of a processing session"""
     try:
-        with session_lock:
-            session = processing_sessions.get(session_id)
+        session = processing_sessions.get(session_id)
         
         if not session:
             return jsonify({'error': 'Session not found'}), 404
@@ -731,6 +1204,92 @@ def session_status(session_id):
     except Exception as e:
         return jsonify({'error': f'Error getting session status: {str(e)}'}), 500
 
+# Companies listed in the company details "not found" error
+AVAILABLE_COMPANIES_LIMIT = 20
+
+# Shown in company details for CEO profiles without a name or headline
+DEFAULT_PROFILE_NAME = 'CEO Profile'
+DEFAULT_PROFILE_HEADLINE = 'Profile found via Google search'
+
+def _company_details_payload(result):
+    """Company details response body for one result"""
+    company_data = result.get('company_website_data', {})
+    ceo_data = result.get('ceo_data', {})
+    ceo_profiles = ceo_data.get('ceo_profiles', {})
+    
+    # Collect all found links
+    all_links = {
+        'emails': company_data.get('emails', []),
+        'phones': company_data.get('phones', []),
+        'website_social_links': company_data.get('socialLinks', {}),
+        # CEO profiles that have a URL
+        'ceo_profiles': {
+            platform: {
+                'url': profile_data['url'],
+                'name': profile_data.get('name', DEFAULT_PROFILE_NAME),
+                'headline': profile_data.get('headline', DEFAULT_PROFILE_HEADLINE)
+            }
+            for platform, profile_data in ceo_profiles.items()
+            if isinstance(profile_data, dict) and profile_data.get('url')
+        }
+    }
+    
+    return {
+        'success': True,
+        'company_name': result.get('company_name', ''),
+        'company_domain': result.get('company_domain', ''),
+        'timestamp': _format_timestamp(result.get('timestamp', time.time())),
+        'processing_status': 'Success' if result.get('success') else 'Failed',
+        'details': all_links,
+        'ceo_email': ceo_data.get('ceo_email', ''),
+        'email_confidence': ceo_data.get('email_confidence', 0),
+        'errors': result.get('errors', [])
+    }
+
+def _find_company(session, company_domain):
+    """The session result matching a domain or company name, or None"""
+    # Find the company result by domain (more reliable than name), exact matches straight from the index
+    search_domain = _norm_domain(company_domain)
+    company_result = (session.results_by_domain.get(search_domain)
+                      or session.results_by_name.get(company_domain.lower()))
+    logger.debug("Debug: Looking for company with domain containing: '%s'", company_domain)
+    
+    if not company_result:
+        # Subdomain matches either way, each a dict lookup per domain label:
+        # the query under a result's domain, then a result under the query's domain
+        for suffix in _domain_suffixes(search_domain):
+            company_result = session.results_by_domain.get(suffix)
+            if company_result:
+                break
+        else:
+            company_result = session.find_subdomain_result(search_domain)
+        if company_result:
+            logger.debug("Debug: Found matching company: %s", company_result.get('company_name', ''))
+    
+    if not company_result:
+        # Fallback: try to match by company name if domain matching failed
+        logger.debug("Debug: Domain matching failed, trying to match by name: '%s'", company_domain)
+        # Names in the index are already lowercased and non-empty; lowercase the query once
+        query = company_domain.lower()
+        # Snapshot the index: the coordinator thread keeps adding results while a run is active
+        for result_name, result in list(session.results_by_name.items()):
+            if query in result_name or result_name in query:
+                company_result = result
+                logger.debug("Debug: Found matching company by name: %s", result.get('company_name'))
+                break
+    
+    return company_result
+
+@lru_cache(maxsize=4096)
+def _find_company_cached(session_id, version, company_domain):
+    """_find_company memoized per session results version; a new result changes the key, so stale entries just age out"""
+    session = processing_sessions.get(session_id)
+    company_result = _find_company(session, company_domain) if session else None
+    if company_result is None:
+        # lru_cache doesn't store exceptions, so misses are looked up again next time
+        raise LookupError(company_domain)
+    return company_result
+
 @app.route('/company_details/<session_id>/<path:company_domain>')
 def get_company_details(session_id, company_domain):
     """Get detailed information for a specific company by domain"""
@@ -739,152 +1298,170 @@ def get_company_details(session_id, company_domain):
         from urllib.parse import unquote
         company_domain = unquote(company_domain)
         
-        with session_lock:
-            session = processing_sessions.get(session_id)
+        session = processing_sessions.get(session_id)
         
         if not session:
             return jsonify({'error': 'Session not found'}), 404
         
-        # Find the company result by domain (more reliable than name)
-        company_result = None
-        print(f"Debug: Looking for company with domain containing: '{company_domain}'")
-        
-        # Clean the search domain for better matching
-        search_domain = company_domain.replace('https://', '').replace('http://', '').replace('www.', '').lower()
-        
-        for i, result in enumerate(session.results):
-            result_domain = result.get('company_domain', '')
-            result_name = result.get('company_name', '')
-            
-            # Clean the result domain for comparison
-            clean_result_domain = result_domain.replace('https://', '').replace('http://', '').replace('www.', '').lower()
-            
-            print(f"Debug: Checking result {i}: domain='{result_domain}', clean_domain='{clean_result_domain}', name='{result_name}'")
-            
-            # Handle different domain formats - be more flexible
-            domain_matches = (
-                search_domain in clean_result_domain or 
-                clean_result_domain in search_domain or
-                search_domain == clean_result_domain or
-                company_domain.lower() in result_domain.lower() or
-                result_domain.lower().endswith(search_domain)
-            )
-            
-            if domain_matches:
-                company_result = result
-                print(f"Debug: Found matching company: {result_name}")
-                break
-        
-        if not company_result:
-            # Fallback: try to match by company name if domain matching failed
-            print(f"Debug: Domain matching failed, trying to match by name: '{company_domain}'")
-            for i, result in enumerate(session.results):
-                result_name = result.get('company_name', '').lower()
-                if company_domain.lower() in result_name or result_name in company_domain.lower():
-                    company_result = result
-                    print(f"Debug: Found matching company by name: {result.get('company_name')}")
-                    break
+        # Repeat lookups while the session's results are unchanged are one cache probe
+        try:
+            company_result = _find_company_cached(session_id, session.version, company_domain)
+        except LookupError:
+            company_result = None
         
         if not company_result:
             # Debug: List available companies for troubleshooting
-            available_companies = [f"{r.get('company_name', 'N/A')} ({r.get('company_domain', 'N/A')})" for r in session.results]
-            print(f"Debug: Company '{company_domain}' not found. Available companies: {available_companies}")
+            # Only the first few, so the error stays small for large sessions
+            available_companies = [f"{r.get('company_name', 'N/A')} ({r.get('company_domain', 'N/A')})"
+                                   for r in session.results[:AVAILABLE_COMPANIES_LIMIT]]
+            logger.debug("Debug: Company '%s' not found. Available companies: %s", company_domain, available_companies)
             return jsonify({
                 'error': f'Company not found for domain: {company_domain}',
-                'available_companies': available_companies
+                'available_companies': available_companies,
+                'total_companies': len(session.results)
             }), 404
         
-        # Format detailed response
-        company_data = company_result.get('company_website_data', {})
-        ceo_data = company_result.get('ceo_data', {})
-        ceo_profiles = ceo_data.get('ceo_profiles', {})
-        
-        # Collect all found links
-        all_links = {
-            'emails': company_data.get('emails', []),
-            'phones': company_data.get('phones', []),
-            'website_social_links': company_data.get('socialLinks', {}),
-            'ceo_profiles': {}
-        }
-        
-        # Process CEO profiles
-        for platform, profile_data in ceo_profiles.items():
-            if isinstance(profile_data, dict) and profile_data.get('url'):
-                all_links['ceo_profiles'][platform] = {
-                    'url': profile_data['url'],
-                    'name': profile_data.get('name', 'CEO Profile'),
-                    'headline': profile_data.get('headline', 'Profile found via Google search')
-                }
-        
-        return jsonify({
-            'success': True,
-            'company_name': company_result.get('company_name', ''),
-            'company_domain': company_result.get('company_domain', ''),
-            'timestamp': datetime.fromtimestamp(company_result.get('timestamp', time.time())).strftime('%Y-%m-%d %H:%M:%S'),
-            'processing_status': 'Success' if company_result.get('success') else 'Failed',
-            'details': all_links,
-            'ceo_email': ceo_data.get('ceo_email', ''),
-            'email_confidence': ceo_data.get('email_confidence', 0),
-            'errors': company_result.get('errors', [])
-        })
+        # A result doesn't change once added, so its response is serialized once and reused
+        cached = session._details_json.get(id(company_result))
+        if cached is None:
+            cached = _json_dumps(_company_details_payload(company_result))
+            session._details_json[id(company_result)] = cached
+        return Response(cached, mimetype='application/json')
         
     except Exception as e:
         return jsonify({'error': f'Error getting company details: {str(e)}'}), 500
 
+def _is_terminal_event(event, data):
+    """Whether a published event ends a run: a pause, or the batch carrying processing_complete"""
+    if event == 'processing_paused':
+        return True
+    return event == 'batch' and any(e['event'] == 'processing_complete' for e in data['events'])
+
+@app.route('/progress/<session_id>')
+def progress_stream(session_id):
+    """Server-Sent Events stream of a session's progress, log and result events"""
+    session = processing_sessions.get(session_id)
+    
+    if not session:
+        return jsonify({'error': 'Session not found'}), 404
+    
+    # Sent by EventSource when it reconnects; the events after it are replayed first
+    try:
+        last_event_id = int(request.headers['Last-Event-ID'])
+    except (KeyError, ValueError):
+        last_event_id = None
+    
+    def stream():
+        subscriber = session.subscribe(last_event_id)
+        # Each open stream holds a server thread, so none is kept forever: it ends after the run
+        # finishes or pauses, when the session sits idle, or after SSE_MAX_STREAM_SECONDS
+        deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+        closing_at = None
+        try:
+            yield f'retry: {SSE_RETRY_MS}\n\n'
+            while True:
+                now = time.monotonic()
+                if closing_at is not None and now >= closing_at:
+                    # Tells the client not to reconnect until it starts or resumes the session
+                    yield 'event: end\ndata: {}\n\n'
+                    return
+                if now >= deadline:
+                    # Dropped without 'end', so EventSource reconnects on its own and sends
+                    # Last-Event-ID, which replays whatever was published in between
+                    return
+                try:
+                    event_id, event, data = subscriber.get(timeout=min(SSE_HEARTBEAT_INTERVAL, (closing_at or deadline) - now))
+                except queue.Empty:
+                    if closing_at is None and not session.is_running:
+                        closing_at = now
+                    elif closing_at is None:
+                        # Comment line keeps proxies from closing an idle stream
+                        yield ': keep-alive\n\n'
+                    continue
+                id_line = f'id: {event_id}\n' if event_id is not None else ''
+                yield f"{id_line}event: {event}\ndata: {_json_dumps(data).decode('utf-8')}\n\n"
+                if closing_at is None and _is_terminal_event(event, data):
+                    # A short grace lets the run's last log batch through
+                    closing_at = time.monotonic() + SSE_CLOSE_GRACE
+        finally:
+            session.unsubscribe(subscriber)
+    
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/download_results/<session_id>')
 def download_results(session_id):
     """Download CSV results for a session"""
     try:
-        with session_lock:
-            session = processing_sessions.get(session_id)
+        session = processing_sessions.get(session_id)
         
         if not session:
             return jsonify({'error': 'Session not found'}), 404
         
-        if not os.path.exists(session.results_file_path):
-            return jsonify({'error': 'Results file not found'}), 404
-        
+        # Conditional requests get a 304 while the CSV hasn't changed
         return send_file(
             session.results_file_path,
             as_attachment=True,
             download_name=f'contact_finder_results_{session_id}.csv',
-            mimetype='text/csv'
+            mimetype='text/csv',
+            conditional=True,
+            etag=session.results_etag or True,
+            last_modified=session.results_mtime
         )
         
+    except FileNotFoundError:
+        return jsonify({'error': 'Results file not found'}), 404
     except Exception as e:
         return jsonify({'error': f'Error downloading results: {str(e)}'}), 500
 
 # SocketIO event handlers
 @socketio.on('connect')
 def handle_connect():
-    print('Client connected')
+    logger.info('Client connected')
 
 @socketio.on('disconnect')
 def handle_disconnect():
-    print('Client disconnected')
+    logger.info('Client disconnected')
 
 @socketio.on('join_session')
 def handle_join_session(data):
     session_id = data.get('session_id')
     if session_id:
-        print(f'Client joined session: {session_id}')
+        logger.info(f'Client joined session: {session_id}')
 
 def cleanup_all_sessions():
-    """Clean up browser resources for all active sessions"""
-    print("🧹 Cleaning up all browser sessions...")
+    """Pause and save every running session so it can be resumed after a restart"""
+    if not processing_sessions:
+        return
+    
+    logger.info("🧹 Saving running sessions...")
+    # Snapshot under the lock, then save without holding it
     with session_lock:
-        for session_id, session in processing_sessions.items():
-            try:
-                if hasattr(session, 'contact_finder'):
-                    session.contact_finder.cleanup_browser()
-                    print(f"   ✅ Cleaned session {session_id}")
-            except Exception as e:
-                print(f"   ❌ Error cleaning session {session_id}: {e}")
-    print("🏁 All sessions cleaned up")
+        sessions = [(session_id, session) for session_id, session in processing_sessions.items() if session.is_running]
+    
+    # Pausing makes every worker thread skip its remaining companies and close its own browser
+    # (Playwright objects can only be closed from the thread that made them)
+    for _, session in sessions:
+        session.is_paused = True
+    # Workers still in the middle of a company get a bounded wait; they are daemon threads, so exit isn't blocked
+    deadline = time.monotonic() + SHUTDOWN_WORKER_TIMEOUT
+    for _, session in sessions:
+        for worker in session._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+    
+    for session_id, session in sessions:
+        try:
+            session.save_progress()
+            logger.info(f"   ✅ Saved session {session_id}")
+        except Exception as e:
+            logger.error(f"   ❌ Error saving session {session_id}: {e}")
+    logger.info("🏁 All sessions cleaned up")
 
 def signal_handler(sig, frame):
     """Handle shutdown signals"""
-    print("\n🛑 Shutdown signal received, cleaning up...")
+    logger.info("\n🛑 Shutdown signal received, cleaning up...")
     cleanup_all_sessions()
     exit(0)
 
@@ -893,25 +1470,24 @@ if __name__ == '__main__':
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Create necessary directories
-    for folder in ['uploads', 'progress_files', 'results']:
-        os.makedirs(folder, exist_ok=True)
-    
-    print("🚀 Starting Contact Finder Web Interface...")
-    print("📂 Upload folder:", app.config['UPLOAD_FOLDER'])
-    print("📊 Progress folder:", app.config['PROGRESS_FOLDER'])
-    print("📁 Results folder:", app.config['RESULTS_FOLDER'])
-    print("🔍 Browser will be persistent across companies (more efficient)")
-    print("👀 Browser will be visible for manual captcha solving")
+    logger.info("🚀 Starting Contact Finder Web Interface...")
+    logger.info(f"📂 Upload folder: {app.config['UPLOAD_FOLDER']}")
+    logger.info(f"📊 Progress folder: {app.config['PROGRESS_FOLDER']}")
+    logger.info(f"📁 Results folder: {app.config['RESULTS_FOLDER']}")
+    logger.info("🔍 Browser will be persistent across companies (more efficient)")
+    logger.info("👀 Browser will be visible for manual captcha solving")
     
     try:
-        # Run with SocketIO
-        socketio.run(app, host='0.0.0.0', port=5001, debug=True)
+        # Run with SocketIO. Debug mode and the reloader are off unless FLASK_DEBUG=1: they wrap every
+        # request and would restart the process under running sessions. Still threaded (see async_mode);
+        # behind gunicorn use one worker with threads: gunicorn -w 1 --threads 100 web_interface:app
+        debug = os.environ.get('FLASK_DEBUG') == '1'
+        socketio.run(app, host='0.0.0.0', port=5001, debug=debug, use_reloader=False, allow_unsafe_werkzeug=True)
     except KeyboardInterrupt:
-        print("\n🛑 Keyboard interrupt received, cleaning up...")
+        logger.info("\n🛑 Keyboard interrupt received, cleaning up...")
         cleanup_all_sessions()
     except Exception as e:
-        print(f"\n❌ Error running web interface: {e}")
+        logger.error(f"\n❌ Error running web interface: {e}")
         cleanup_all_sessions()
     finally:
         cleanup_all_sessions()
\ No newline at end of file